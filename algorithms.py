@@ -3,10 +3,548 @@ Algorithms Module
 Implements RRA (Robot Ranking Algorithm), A* pathfinding, and optimization algorithms
 """
 
+import functools
 import numpy as np
 import heapq
-from typing import List, Tuple, Optional, Dict
-from hospital_config import HOSPITAL_MAP, get_neighbors, manhattan_distance, euclidean_distance
+from typing import List, Tuple, Optional, Dict, FrozenSet, Union
+from hospital_config import WALKABLE, _manhattan
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    # Only the spatial index for very large fleets needs scipy
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("⚠️  Warning: numba library not installed. Using pure-Python pathfinding.")
+    print("   Install with: pip install numba")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so the kernels below stay importable"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Walkability mask of the static map, built once at import by hospital_config
+_WALKABLE = WALKABLE
+_H, _W = _WALKABLE.shape
+
+# Blocked-cell scratch grid for the compiled kernels (blocked=1). Kernels mark
+# their query's obstacles in it on entry and clear exactly those cells again
+# before returning, so no per-search copy of the map is needed
+_BLOCKER = np.ascontiguousarray(~_WALKABLE, dtype=np.uint8)
+
+# 4-connected neighbor offsets: down, right, up, left
+_DIRS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Nested-list copy of the mask: indexing NumPy scalars from interpreted loops is
+# slower than plain list indexing, so the pure-Python searches read this one
+_WALKABLE_ROWS = _WALKABLE.tolist()
+
+
+@njit(cache=True)
+def _mark_blockers(blocker, obs_flat):
+    """
+    Block obstacle cells in a flat scratch grid
+    
+    Returns:
+        int32 array of the cells that were free before, for _clear_blockers
+    """
+    touched = np.empty(obs_flat.size, dtype=np.int32)
+    n = 0
+    for i in range(obs_flat.size):
+        cell = obs_flat[i]
+        if blocker[cell] == 0:
+            blocker[cell] = 1
+            touched[n] = cell
+            n += 1
+    return touched[:n]
+
+
+@njit(cache=True)
+def _clear_blockers(blocker, touched):
+    """Undo _mark_blockers"""
+    for i in range(touched.size):
+        blocker[touched[i]] = 0
+
+
+@njit(cache=True)
+def _dheap_push(keys, vals, n, key, val):
+    """
+    Push onto a 4-ary min-heap stored in parallel keys/vals arrays
+    
+    Returns:
+        (keys, vals, n) - the arrays are reallocated at twice the size when full
+    """
+    if n == keys.size:
+        new_keys = np.empty(2 * keys.size, dtype=keys.dtype)
+        new_vals = np.empty(2 * vals.size, dtype=vals.dtype)
+        new_keys[:n] = keys[:n]
+        new_vals[:n] = vals[:n]
+        keys = new_keys
+        vals = new_vals
+    
+    i = n
+    while i > 0:
+        parent = (i - 1) >> 2
+        if keys[parent] <= key:
+            break
+        keys[i] = keys[parent]
+        vals[i] = vals[parent]
+        i = parent
+    keys[i] = key
+    vals[i] = val
+    return keys, vals, n + 1
+
+
+@njit(cache=True)
+def _dheap_pop(keys, vals, n):
+    """
+    Pop the smallest key from a 4-ary min-heap (see _dheap_push)
+    
+    Returns:
+        (key, val, n) of the removed entry and the new heap size
+    """
+    top_key = keys[0]
+    top_val = vals[0]
+    n -= 1
+    key = keys[n]
+    val = vals[n]
+    
+    i = 0
+    while True:
+        first = 4 * i + 1
+        if first >= n:
+            break
+        best = first
+        for child in range(first + 1, min(first + 4, n)):
+            if keys[child] < keys[best]:
+                best = child
+        if keys[best] >= key:
+            break
+        keys[i] = keys[best]
+        vals[i] = vals[best]
+        i = best
+    keys[i] = key
+    vals[i] = val
+    return top_key, top_val, n
+
+
+@njit(cache=True)
+def _heap_key(priority, counter):
+    """Pack (priority, insertion counter) into one int64 heap key, FIFO on ties"""
+    return (np.int64(priority) << 32) + counter
+
+
+@njit(cache=True)
+def _trace_path(came_from, goal, W):
+    """
+    Follow parent pointers back from goal
+    
+    Measures the chain first, then fills one preallocated array right to left,
+    so there is no list growth or reversal.
+    
+    Returns:
+        int32 array of shape (n, 2) holding (x, y) from the root to goal
+    """
+    n = 0
+    current = goal
+    while current != -1:
+        n += 1
+        current = came_from[current]
+    
+    path = np.empty((n, 2), dtype=np.int32)
+    current = goal
+    for i in range(n - 1, -1, -1):
+        path[i, 0] = current % W
+        path[i, 1] = current // W
+        current = came_from[current]
+    return path
+
+
+@njit(cache=True, inline='always')
+def _astar_core(blocker, W, H, sx, sy, ex, ey, obs_flat):
+    """
+    A* kernel on a flat blocked-cell grid using integer cell indices (y * W + x)
+    
+    Inlined into its callers, so a caller that passes W and H as compile-time
+    constants (see make_astar) gets the bounds checks folded to immediates.
+    
+    Returns:
+        int32 array of shape (n, 2) with (x, y) from start to end, empty if unreachable
+    """
+    touched = _mark_blockers(blocker, obs_flat)
+    
+    INF = np.iinfo(np.int32).max
+    g_score = np.full(W * H, INF, dtype=np.int32)
+    came_from = np.full(W * H, -1, dtype=np.int32)
+    closed = np.zeros(W * H, dtype=np.uint8)
+    
+    start = sy * W + sx
+    goal = ey * W + ex
+    g_score[start] = 0
+    
+    # 4-ary heap of (f_score, counter) keys over cell indices; the counter
+    # keeps FIFO tie-breaking
+    counter = 0
+    heap_keys = np.empty(max(16, W * H), dtype=np.int64)
+    heap_cells = np.empty(max(16, W * H), dtype=np.int32)
+    heap_keys, heap_cells, heap_n = _dheap_push(heap_keys, heap_cells, 0,
+                                                _heap_key(_manhattan(sx, sy, ex, ey), counter),
+                                                start)
+    
+    while heap_n > 0:
+        _, current, heap_n = _dheap_pop(heap_keys, heap_cells, heap_n)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        
+        if current == goal:
+            _clear_blockers(blocker, touched)
+            return _trace_path(came_from, current, W)
+        
+        cx = current % W
+        cy = current // W
+        for dx, dy in _DIRS:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= W or ny < 0 or ny >= H:
+                continue
+            neighbor = ny * W + nx
+            if blocker[neighbor] or closed[neighbor]:
+                continue
+            
+            tentative_g_score = g_score[current] + 1
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                counter += 1
+                heap_keys, heap_cells, heap_n = _dheap_push(
+                    heap_keys, heap_cells, heap_n,
+                    _heap_key(tentative_g_score + _manhattan(nx, ny, ex, ey), counter),
+                    neighbor)
+    
+    _clear_blockers(blocker, touched)
+    return np.empty((0, 2), dtype=np.int32)
+
+
+@njit(cache=True)
+def _astar_nb(blocked, sx, sy, ex, ey, obs_flat):
+    """A* kernel for a blocked-cell grid of any shape (see _astar_core)"""
+    H, W = blocked.shape
+    return _astar_core(blocked.reshape(W * H), W, H, sx, sy, ex, ey, obs_flat)
+
+
+def make_astar(blocked: np.ndarray):
+    """
+    Build an A* kernel specialized to one grid shape
+    
+    The grid's width and height are captured as plain ints, which numba
+    freezes into the compiled code as constants. The kernel still takes the
+    flat blocked-cell grid as an argument, because it marks obstacles in it
+    and arrays captured by a closure are frozen read-only.
+    
+    Args:
+        blocked: (H, W) uint8 blocked-cell grid the kernel will be called with
+    
+    Returns:
+        Compiled function (blocker, sx, sy, ex, ey, obs_flat) -> (n, 2) path,
+        where blocker is the flat view of a grid shaped like blocked
+    """
+    H, W = (int(size) for size in blocked.shape)
+    
+    @njit(cache=True)
+    def astar(blocker, sx, sy, ex, ey, obs_flat):
+        return _astar_core(blocker, W, H, sx, sy, ex, ey, obs_flat)
+    
+    return astar
+
+
+@njit(cache=True)
+def _dijkstra_nb(blocked, sx, sy, ex, ey, obs_flat):
+    """Dijkstra kernel on a flat blocked-cell grid (see _astar_nb)"""
+    H, W = blocked.shape
+    blocker = blocked.reshape(W * H)
+    touched = _mark_blockers(blocker, obs_flat)
+    
+    INF = np.iinfo(np.int32).max
+    distances = np.full(W * H, INF, dtype=np.int32)
+    came_from = np.full(W * H, -1, dtype=np.int32)
+    visited = np.zeros(W * H, dtype=np.uint8)
+    
+    start = sy * W + sx
+    goal = ey * W + ex
+    distances[start] = 0
+    
+    counter = 0
+    heap_keys = np.empty(max(16, W * H), dtype=np.int64)
+    heap_cells = np.empty(max(16, W * H), dtype=np.int32)
+    heap_keys, heap_cells, heap_n = _dheap_push(heap_keys, heap_cells, 0,
+                                                _heap_key(0, counter), start)
+    
+    while heap_n > 0:
+        key, current, heap_n = _dheap_pop(heap_keys, heap_cells, heap_n)
+        dist = key >> 32
+        if visited[current]:
+            continue
+        visited[current] = 1
+        
+        if current == goal:
+            _clear_blockers(blocker, touched)
+            return _trace_path(came_from, current, W)
+        
+        cx = current % W
+        cy = current // W
+        for dx, dy in _DIRS:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= W or ny < 0 or ny >= H:
+                continue
+            neighbor = ny * W + nx
+            if blocker[neighbor] or visited[neighbor]:
+                continue
+            
+            new_dist = dist + 1
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                came_from[neighbor] = current
+                counter += 1
+                heap_keys, heap_cells, heap_n = _dheap_push(
+                    heap_keys, heap_cells, heap_n, _heap_key(new_dist, counter), neighbor)
+    
+    _clear_blockers(blocker, touched)
+    return np.empty((0, 2), dtype=np.int32)
+
+
+@njit(cache=True)
+def _bfs_nb(blocked, sx, sy, ex, ey, obs_flat):
+    """Breadth-first search kernel on a flat blocked-cell grid (see _astar_nb)"""
+    H, W = blocked.shape
+    blocker = blocked.reshape(W * H)
+    touched = _mark_blockers(blocker, obs_flat)
+    
+    came_from = np.full(W * H, -1, dtype=np.int32)
+    seen = np.zeros(W * H, dtype=np.uint8)
+    queue = np.empty(W * H, dtype=np.int32)
+    
+    start = sy * W + sx
+    goal = ey * W + ex
+    queue[0] = start
+    seen[start] = 1
+    head = 0
+    tail = 1
+    
+    while head < tail:
+        current = queue[head]
+        head += 1
+        
+        if current == goal:
+            _clear_blockers(blocker, touched)
+            return _trace_path(came_from, current, W)
+        
+        cx = current % W
+        cy = current // W
+        for dx, dy in _DIRS:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= W or ny < 0 or ny >= H:
+                continue
+            neighbor = ny * W + nx
+            if blocker[neighbor] or seen[neighbor]:
+                continue
+            
+            seen[neighbor] = 1
+            came_from[neighbor] = current
+            queue[tail] = neighbor
+            tail += 1
+    
+    _clear_blockers(blocker, touched)
+    return np.empty((0, 2), dtype=np.int32)
+
+
+@njit(cache=True)
+def _bidir_astar_nb(blocked, sx, sy, ex, ey, obs_flat):
+    """
+    Bidirectional A* kernel on a flat blocked-cell grid (see _astar_nb)
+    
+    Frontier 0 searches forward from the start towards the end and frontier 1
+    backward from the end towards the start; the smaller one is expanded.
+    mu tracks the best start-end path found through a cell seen by both
+    frontiers, and the search stops once either frontier's best f reaches it.
+    """
+    H, W = blocked.shape
+    start = sy * W + sx
+    goal = ey * W + ex
+    if start == goal:
+        path = np.empty((1, 2), dtype=np.int32)
+        path[0, 0] = sx
+        path[0, 1] = sy
+        return path
+    
+    blocker = blocked.reshape(W * H)
+    touched = _mark_blockers(blocker, obs_flat)
+    if blocker[goal]:
+        _clear_blockers(blocker, touched)
+        return np.empty((0, 2), dtype=np.int32)
+    
+    INF = np.iinfo(np.int32).max
+    g_score = np.full((2, W * H), INF, dtype=np.int32)
+    came_from = np.full((2, W * H), -1, dtype=np.int32)
+    closed = np.zeros((2, W * H), dtype=np.uint8)
+    target_x = (ex, sx)
+    target_y = (ey, sy)
+    g_score[0, start] = 0
+    g_score[1, goal] = 0
+    
+    # One 4-ary heap per frontier (see _astar_nb)
+    counter = 0
+    h = _manhattan(sx, sy, ex, ey)
+    keys_f = np.empty(max(16, W * H), dtype=np.int64)
+    cells_f = np.empty(max(16, W * H), dtype=np.int32)
+    keys_f, cells_f, n_f = _dheap_push(keys_f, cells_f, 0, _heap_key(h, counter), start)
+    keys_b = np.empty(max(16, W * H), dtype=np.int64)
+    cells_b = np.empty(max(16, W * H), dtype=np.int32)
+    keys_b, cells_b, n_b = _dheap_push(keys_b, cells_b, 0, _heap_key(h, counter), goal)
+    mu = INF
+    meet = -1
+    
+    while n_f > 0 and n_b > 0:
+        if (keys_f[0] >> 32) >= mu or (keys_b[0] >> 32) >= mu:
+            break
+        
+        side = 0 if n_f <= n_b else 1
+        if side == 0:
+            _, current, n_f = _dheap_pop(keys_f, cells_f, n_f)
+        else:
+            _, current, n_b = _dheap_pop(keys_b, cells_b, n_b)
+        if closed[side, current]:
+            continue
+        closed[side, current] = 1
+        
+        tx = target_x[side]
+        ty = target_y[side]
+        cx = current % W
+        cy = current // W
+        for dx, dy in _DIRS:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= W or ny < 0 or ny >= H:
+                continue
+            neighbor = ny * W + nx
+            # The start cell is left even when blocked, as in _astar_nb
+            if (blocker[neighbor] and neighbor != start) or closed[side, neighbor]:
+                continue
+            
+            tentative_g_score = g_score[side, current] + 1
+            if tentative_g_score < g_score[side, neighbor]:
+                came_from[side, neighbor] = current
+                g_score[side, neighbor] = tentative_g_score
+                counter += 1
+                key = _heap_key(tentative_g_score + _manhattan(nx, ny, tx, ty), counter)
+                if side == 0:
+                    keys_f, cells_f, n_f = _dheap_push(keys_f, cells_f, n_f, key, neighbor)
+                else:
+                    keys_b, cells_b, n_b = _dheap_push(keys_b, cells_b, n_b, key, neighbor)
+                
+                other_g = g_score[1 - side, neighbor]
+                if other_g != INF and tentative_g_score + other_g < mu:
+                    mu = tentative_g_score + other_g
+                    meet = neighbor
+    
+    _clear_blockers(blocker, touched)
+    if meet == -1:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    # Splice start -> meet (forward tree, filled right to left) with
+    # meet -> end (backward tree, filled left to right)
+    head = _trace_path(came_from[0], meet, W)
+    n_head = head.shape[0]
+    n = n_head
+    current = came_from[1, meet]
+    while current != -1:
+        n += 1
+        current = came_from[1, current]
+    
+    path = np.empty((n, 2), dtype=np.int32)
+    path[:n_head] = head
+    current = came_from[1, meet]
+    for i in range(n_head, n):
+        path[i, 0] = current % W
+        path[i, 1] = current // W
+        current = came_from[1, current]
+    return path
+
+
+@njit(cache=True)
+def _count_turns_nb(path_xy):
+    """Count direction changes between consecutive steps of an (n, 2) path"""
+    turns = 0
+    n = path_xy.shape[0]
+    if n < 3:
+        return 0
+    pdx = path_xy[1, 0] - path_xy[0, 0]
+    pdy = path_xy[1, 1] - path_xy[0, 1]
+    for i in range(2, n):
+        dx = path_xy[i, 0] - path_xy[i - 1, 0]
+        dy = path_xy[i, 1] - path_xy[i - 1, 1]
+        if dx != pdx or dy != pdy:
+            turns += 1
+            pdx = dx
+            pdy = dy
+    return turns
+
+
+# A* specialized to the static map's shape, working on a flat view of _BLOCKER
+_astar_static = make_astar(_BLOCKER)
+_BLOCKER_FLAT = _BLOCKER.reshape(-1)
+
+
+def _on_grid(pos: Tuple[int, int]) -> bool:
+    """Check whether a position lies inside the occupancy grid"""
+    return 0 <= pos[0] < _W and 0 <= pos[1] < _H
+
+
+def _flat(x: int, y: int) -> int:
+    """Flat grid index of (x, y), as used by the kernels and reservations"""
+    return y * _W + x
+
+
+def _obstacle_key(obstacles) -> FrozenSet[Tuple[int, int]]:
+    """
+    Normalise an obstacle collection to a hashable frozenset of (x, y) tuples
+    
+    Args:
+        obstacles: None, a set of positions, a sequence of (x, y) pairs or an
+            (n, 2) array such as get_map_positions()['obstacles']
+    
+    Returns:
+        Frozenset of (x, y) tuples usable as a cache key
+    """
+    if obstacles is None:
+        return frozenset()
+    if isinstance(obstacles, (set, frozenset)):
+        return frozenset(obstacles)
+    return frozenset(map(tuple, np.asarray(obstacles, dtype=np.int64).reshape(-1, 2).tolist()))
+
+
+def _flatten_obstacles(obstacles: Optional[List[Tuple[int, int]]]) -> np.ndarray:
+    """Convert (x, y) obstacle positions to flat grid indices for the kernels"""
+    if not obstacles:
+        return np.empty(0, dtype=np.int32)
+    return np.array([_flat(x, y) for x, y in obstacles if 0 <= x < _W and 0 <= y < _H],
+                    dtype=np.int32)
+
+
+def _tuple_path(xy_path: np.ndarray) -> List[Tuple[int, int]]:
+    """Convert an (n, 2) path returned by a kernel to a list of (x, y) tuples"""
+    return list(map(tuple, xy_path.tolist()))
+
 
 class PathfindingAlgorithms:
     """Collection of pathfinding algorithms"""
@@ -25,8 +563,16 @@ class PathfindingAlgorithms:
         Returns:
             List of positions representing the path, or empty list if no path found
         """
-        if obstacles is None:
-            obstacles = []
+        obstacles = _obstacle_key(obstacles)
+        return list(_a_star_cached(tuple(start), tuple(end), obstacles))
+    
+    @staticmethod
+    def _a_star_search(start: Tuple[int, int], end: Tuple[int, int],
+                       obstacles: FrozenSet[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Uncached A* search behind a_star()"""
+        if NUMBA_AVAILABLE and _on_grid(start) and _on_grid(end):
+            return _tuple_path(_astar_static(_BLOCKER_FLAT, start[0], start[1], end[0], end[1],
+                                             _flatten_obstacles(obstacles)))
         
         def heuristic(pos1, pos2):
             """Manhattan distance heuristic"""
@@ -39,12 +585,15 @@ class PathfindingAlgorithms:
         
         came_from = {}
         g_score = {start: 0}
-        f_score = {start: heuristic(start, end)}
-        open_set_hash = {start}
+        closed = set()
         
         while open_set:
             current = heapq.heappop(open_set)[2]
-            open_set_hash.remove(current)
+            
+            # Lazy deletion: skip stale heap entries for already-expanded nodes
+            if current in closed:
+                continue
+            closed.add(current)
             
             if current == end:
                 # Reconstruct path
@@ -56,29 +605,130 @@ class PathfindingAlgorithms:
                 return path
             
             # Explore neighbors
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            for dx, dy in _DIRS:
                 neighbor = (current[0] + dx, current[1] + dy)
                 
                 # Check if neighbor is valid
-                if (0 <= neighbor[0] < len(HOSPITAL_MAP[0]) and 
-                    0 <= neighbor[1] < len(HOSPITAL_MAP) and
-                    HOSPITAL_MAP[neighbor[1]][neighbor[0]] not in ['#', 'O'] and
-                    neighbor not in obstacles):
+                if (0 <= neighbor[0] < _W and 0 <= neighbor[1] < _H and
+                    _WALKABLE_ROWS[neighbor[1]][neighbor[0]] and
+                    neighbor not in obstacles and
+                    neighbor not in closed):
                     
                     tentative_g_score = g_score[current] + 1
                     
                     if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
                         came_from[neighbor] = current
                         g_score[neighbor] = tentative_g_score
-                        f_score[neighbor] = tentative_g_score + heuristic(neighbor, end)
-                        
-                        if neighbor not in open_set_hash:
-                            counter += 1
-                            heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
-                            open_set_hash.add(neighbor)
+                        counter += 1
+                        heapq.heappush(open_set, (tentative_g_score + heuristic(neighbor, end),
+                                                  counter, neighbor))
         
         return []  # No path found
     
+    @staticmethod
+    def bidir_a_star(start: Tuple[int, int], end: Tuple[int, int], 
+                     obstacles: List[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
+        """
+        Bidirectional A* pathfinding - optimal path from two meeting searches
+        
+        Searches forward from the start and backward from the end at the same
+        time, which expands roughly half the cells of a_star() on routes that
+        cross the map. Paths have the same length as a_star() but may take a
+        different route between equally short options.
+        
+        Args:
+            start: Starting position (x, y)
+            end: Goal position (x, y)
+            obstacles: List of obstacle positions to avoid
+        
+        Returns:
+            List of positions representing the path, or empty list if no path found
+        """
+        obstacles = _obstacle_key(obstacles)
+        return list(_bidir_a_star_cached(tuple(start), tuple(end), obstacles))
+    
+    @staticmethod
+    def _bidir_a_star_search(start: Tuple[int, int], end: Tuple[int, int],
+                             obstacles: FrozenSet[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Uncached bidirectional A* search behind bidir_a_star()"""
+        if NUMBA_AVAILABLE and _on_grid(start) and _on_grid(end):
+            return _tuple_path(_bidir_astar_nb(_BLOCKER, start[0], start[1], end[0], end[1],
+                                               _flatten_obstacles(obstacles)))
+        
+        if start == end:
+            return [start]
+        if not (_on_grid(end) and _WALKABLE_ROWS[end[1]][end[0]]) or end in obstacles:
+            return []
+        
+        # Index 0 is the forward search from start, index 1 the backward one from end
+        targets = (end, start)
+        g_scores = ({start: 0}, {end: 0})
+        came_froms = ({}, {})
+        closeds = (set(), set())
+        h = abs(start[0] - end[0]) + abs(start[1] - end[1])
+        open_sets = ([(h, 0, start)], [(h, 0, end)])
+        counter = 0
+        mu = float('inf')
+        meet = None
+        
+        while open_sets[0] and open_sets[1]:
+            if open_sets[0][0][0] >= mu or open_sets[1][0][0] >= mu:
+                break
+            
+            # Expand the smaller frontier
+            side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+            open_set, g_score, came_from, closed = (open_sets[side], g_scores[side],
+                                                    came_froms[side], closeds[side])
+            other_g_score = g_scores[1 - side]
+            target = targets[side]
+            
+            current = heapq.heappop(open_set)[2]
+            if current in closed:
+                continue
+            closed.add(current)
+            
+            for dx, dy in _DIRS:
+                neighbor = (current[0] + dx, current[1] + dy)
+                
+                # The start cell is left even when blocked, as in a_star()
+                if not (neighbor == start or
+                        (0 <= neighbor[0] < _W and 0 <= neighbor[1] < _H and
+                         _WALKABLE_ROWS[neighbor[1]][neighbor[0]] and
+                         neighbor not in obstacles)):
+                    continue
+                if neighbor in closed:
+                    continue
+                
+                tentative_g_score = g_score[current] + 1
+                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    counter += 1
+                    heapq.heappush(open_set, (tentative_g_score +
+                                              abs(neighbor[0] - target[0]) +
+                                              abs(neighbor[1] - target[1]),
+                                              counter, neighbor))
+                    
+                    if neighbor in other_g_score and tentative_g_score + other_g_score[neighbor] < mu:
+                        mu = tentative_g_score + other_g_score[neighbor]
+                        meet = neighbor
+        
+        if meet is None:
+            return []
+        
+        # Splice start -> meet with meet -> end
+        path = [meet]
+        current = meet
+        while current in came_froms[0]:
+            current = came_froms[0][current]
+            path.append(current)
+        path.reverse()
+        current = meet
+        while current in came_froms[1]:
+            current = came_froms[1][current]
+            path.append(current)
+        return path
+    
     @staticmethod
     def dijkstra(start: Tuple[int, int], end: Tuple[int, int], 
                  obstacles: List[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
@@ -93,8 +743,16 @@ class PathfindingAlgorithms:
         Returns:
             List of positions representing the path
         """
-        if obstacles is None:
-            obstacles = []
+        obstacles = _obstacle_key(obstacles)
+        return list(_dijkstra_cached(tuple(start), tuple(end), obstacles))
+    
+    @staticmethod
+    def _dijkstra_search(start: Tuple[int, int], end: Tuple[int, int],
+                         obstacles: FrozenSet[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Uncached Dijkstra search behind dijkstra()"""
+        if NUMBA_AVAILABLE and _on_grid(start) and _on_grid(end):
+            return _tuple_path(_dijkstra_nb(_BLOCKER, start[0], start[1], end[0], end[1],
+                                            _flatten_obstacles(obstacles)))
         
         # Priority queue: (distance, counter, position)
         pq = []
@@ -123,12 +781,11 @@ class PathfindingAlgorithms:
                 return path
             
             # Explore neighbors
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            for dx, dy in _DIRS:
                 neighbor = (current[0] + dx, current[1] + dy)
                 
-                if (0 <= neighbor[0] < len(HOSPITAL_MAP[0]) and 
-                    0 <= neighbor[1] < len(HOSPITAL_MAP) and
-                    HOSPITAL_MAP[neighbor[1]][neighbor[0]] not in ['#', 'O'] and
+                if (0 <= neighbor[0] < _W and 0 <= neighbor[1] < _H and
+                    _WALKABLE_ROWS[neighbor[1]][neighbor[0]] and
                     neighbor not in obstacles and
                     neighbor not in visited):
                     
@@ -156,8 +813,16 @@ class PathfindingAlgorithms:
         Returns:
             List of positions representing the path
         """
-        if obstacles is None:
-            obstacles = []
+        obstacles = _obstacle_key(obstacles)
+        return list(_bfs_cached(tuple(start), tuple(end), obstacles))
+    
+    @staticmethod
+    def _bfs_search(start: Tuple[int, int], end: Tuple[int, int],
+                    obstacles: FrozenSet[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Uncached BFS search behind bfs()"""
+        if NUMBA_AVAILABLE and _on_grid(start) and _on_grid(end):
+            return _tuple_path(_bfs_nb(_BLOCKER, start[0], start[1], end[0], end[1],
+                                       _flatten_obstacles(obstacles)))
         
         from collections import deque
         
@@ -176,12 +841,11 @@ class PathfindingAlgorithms:
                 path.reverse()
                 return path
             
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            for dx, dy in _DIRS:
                 neighbor = (current[0] + dx, current[1] + dy)
                 
-                if (0 <= neighbor[0] < len(HOSPITAL_MAP[0]) and 
-                    0 <= neighbor[1] < len(HOSPITAL_MAP) and
-                    HOSPITAL_MAP[neighbor[1]][neighbor[0]] not in ['#', 'O'] and
+                if (0 <= neighbor[0] < _W and 0 <= neighbor[1] < _H and
+                    _WALKABLE_ROWS[neighbor[1]][neighbor[0]] and
                     neighbor not in obstacles and
                     neighbor not in came_from):
                     
@@ -189,21 +853,153 @@ class PathfindingAlgorithms:
                     came_from[neighbor] = current
         
         return []
+    
+    @staticmethod
+    def invalidate_cache():
+        """
+        Drop all memoized a_star/bidir_a_star/dijkstra/bfs results
+        
+        Results are keyed on the exact obstacle set, so reserving or releasing
+        robot paths can never return a stale path; call this when the static
+        map itself changes.
+        """
+        _a_star_cached.cache_clear()
+        _bidir_a_star_cached.cache_clear()
+        _dijkstra_cached.cache_clear()
+        _bfs_cached.cache_clear()
+    
+    @staticmethod
+    def warm_up():
+        """
+        Compile (or load from numba's disk cache) the search kernels ahead of time
+        
+        Runs each kernel once on a trivial query so the first real path request
+        does not pay the JIT latency. Does nothing without numba.
+        """
+        if not NUMBA_AVAILABLE:
+            return
+        free = np.flatnonzero(_BLOCKER_FLAT == 0)
+        if free.size == 0:
+            return
+        y, x = divmod(int(free[0]), _W)
+        no_obstacles = np.empty(0, dtype=np.int32)
+        _astar_static(_BLOCKER_FLAT, x, y, x, y, no_obstacles)
+        for kernel in (_bidir_astar_nb, _dijkstra_nb, _bfs_nb):
+            kernel(_BLOCKER, x, y, x, y, no_obstacles)
+        _count_turns_nb(np.zeros((3, 2), dtype=np.int32))
+
+
+# Path caches for the public search methods. Robots re-plan between the same
+# cells again and again, so repeat queries become a dict lookup; paths are
+# stored as tuples so cached results cannot be mutated by callers
+@functools.lru_cache(maxsize=4096)
+def _a_star_cached(start: Tuple[int, int], end: Tuple[int, int],
+                   obstacles: FrozenSet[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    return tuple(PathfindingAlgorithms._a_star_search(start, end, obstacles))
+
+
+@functools.lru_cache(maxsize=4096)
+def _bidir_a_star_cached(start: Tuple[int, int], end: Tuple[int, int],
+                         obstacles: FrozenSet[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    return tuple(PathfindingAlgorithms._bidir_a_star_search(start, end, obstacles))
+
+
+@functools.lru_cache(maxsize=4096)
+def _dijkstra_cached(start: Tuple[int, int], end: Tuple[int, int],
+                     obstacles: FrozenSet[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    return tuple(PathfindingAlgorithms._dijkstra_search(start, end, obstacles))
+
+
+@functools.lru_cache(maxsize=4096)
+def _bfs_cached(start: Tuple[int, int], end: Tuple[int, int],
+                obstacles: FrozenSet[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    return tuple(PathfindingAlgorithms._bfs_search(start, end, obstacles))
+
+
+# Urgency weighting for tasks created without a precomputed _urgency_mul
+_URGENCY_MULTIPLIERS = {
+    "Normal": 1.0,
+    "Urgent": 1.5,
+    "Emergency": 2.0
+}
+
+
+# Ranking report decorations, indexed by robot availability
+_STATUS_ICONS = ("❌", "✅")
+_RULE = "=" * 70
+
+
+class RobotSpatialIndex:
+    """
+    KD-tree (Manhattan metric) over the positions of available robots
+    
+    Available robots stand still and neither drain nor charge, so the tree
+    (and the velocity/charge maxima kept for pruning) only needs rebuilding
+    when some robot's status changes. The version callable must return a value
+    that changes whenever any status does, e.g. lambda: Robot.status_version.
+    """
+    
+    def __init__(self, version):
+        self._version = version
+        self._built_version = None
+        self._robots = None
+        self._tree = None
+        self.members = np.empty(0, dtype=np.intp)  # Robot indices in the tree
+        self.max_velocity = 0.0
+        self.max_charge = 0.0
+    
+    def refresh(self, robots: List):
+        """Rebuild the tree if robot statuses (or the robot list) changed"""
+        version = self._version()
+        if version == self._built_version and robots is self._robots:
+            return
+        
+        available = [i for i, robot in enumerate(robots) if robot.status.value == "Available"]
+        self.members = np.array(available, dtype=np.intp)
+        if available:
+            chosen = [robots[i] for i in available]
+            self._tree = cKDTree(np.array([(robot.x, robot.y) for robot in chosen],
+                                          dtype=np.float64))
+            self.max_velocity = max(robot.velocity for robot in chosen)
+            self.max_charge = max(robot.charge_percentage for robot in chosen)
+        else:
+            self._tree = None
+        self._built_version, self._robots = version, robots
+    
+    def nearest(self, x: int, y: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k available robots nearest to a position
+        
+        Returns:
+            Tuple of (Manhattan distances, robot indices), nearest first
+        """
+        distances, rows = self._tree.query((x, y), k=k, p=1)
+        return np.atleast_1d(distances), self.members[np.atleast_1d(rows)]
 
 
 class RobotRankingAlgorithm:
     """Robot Ranking Algorithm (RRA) for optimal robot selection"""
     
-    def __init__(self, alpha: float = 0.6, beta: float = 0.4):
+    # Fleets larger than this are ranked with NumPy instead of per-robot calls
+    VECTORIZE_MIN_ROBOTS = 10
+    
+    # Fleets at least this large are searched nearest-first through a
+    # RobotSpatialIndex, when one is given and scipy is installed
+    SPATIAL_MIN_ROBOTS = 128
+    SPATIAL_CANDIDATES = 8
+    
+    def __init__(self, alpha: float = 0.6, beta: float = 0.4, verbose: bool = False):
         """
         Initialize RRA with weight parameters
         
         Args:
             alpha: Weight for speed factor (default: 0.6)
             beta: Weight for energy factor (default: 0.4)
+            verbose: Print the ranking report from find_optimal_robot
         """
         self.alpha = alpha
         self.beta = beta
+        self.verbose = verbose
     
     def calculate_robot_rank(self, robot, task) -> float:
         """
@@ -217,12 +1013,14 @@ class RobotRankingAlgorithm:
             float: Ranking score (higher is better)
         """
         # Only consider available robots
-        if robot.status.value != "Available":
+        status = robot.status.value
+        if status != "Available":
             return 0.0
         
-        # Calculate distances
-        D1 = manhattan_distance((robot.x, robot.y), (task.source_x, task.source_y))
-        D2 = manhattan_distance((task.source_x, task.source_y), (task.dest_x, task.dest_y))
+        # Calculate distances (inline Manhattan, this runs per robot/task pair)
+        sx, sy = task.source_x, task.source_y
+        D1 = abs(robot.x - sx) + abs(robot.y - sy)
+        D2 = abs(sx - task.dest_x) + abs(sy - task.dest_y)
         
         # Avoid division by zero
         total_distance = D1 + D2 + 0.1
@@ -234,65 +1032,198 @@ class RobotRankingAlgorithm:
         # Weight capacity check
         weight_ok = 1.0 if robot.weight_threshold >= task.item_weight else 0.0
         
-        # Urgency multiplier
-        urgency_map = {
-            "Normal": 1.0,
-            "Urgent": 1.5,
-            "Emergency": 2.0
-        }
-        urgency_multiplier = urgency_map.get(task.urgency.value, 1.0)
+        # Urgency multiplier, precomputed when the task is created
+        urgency_multiplier = getattr(task, '_urgency_mul', None)
+        if urgency_multiplier is None:
+            urgency_multiplier = _URGENCY_MULTIPLIERS.get(task.urgency.value, 1.0)
         
         # Calculate final rank
         rank = ((speed_factor + energy_factor) / total_distance) * weight_ok * urgency_multiplier
         
         return rank
     
-    def find_optimal_robot(self, robots: List, task) -> Tuple[Optional[object], float]:
+    @staticmethod
+    def snapshot(robots: List) -> Tuple[np.ndarray, ...]:
+        """
+        Gather the robot fields used for ranking into parallel arrays
+        
+        Args:
+            robots: List of robot objects
+        
+        Returns:
+            Tuple of (x, y, velocity, charge, weight_threshold, available) arrays
+        """
+        rx = np.array([robot.x for robot in robots], dtype=np.float64)
+        ry = np.array([robot.y for robot in robots], dtype=np.float64)
+        vel = np.array([robot.velocity for robot in robots], dtype=np.float64)
+        charge = np.array([robot.charge_percentage for robot in robots], dtype=np.float64)
+        wt_thr = np.array([robot.weight_threshold for robot in robots], dtype=np.float64)
+        available = np.array([robot.status.value == "Available" for robot in robots], dtype=bool)
+        return rx, ry, vel, charge, wt_thr, available
+    
+    def rank_robots(self, robots: List, task) -> np.ndarray:
+        """
+        Calculate the ranking score of every robot for a task
+        
+        Args:
+            robots: List of robot objects
+            task: Task object
+        
+        Returns:
+            Array of scores, 0.0 for unavailable robots
+        """
+        return self._rank(robots, task)[0]
+    
+    def _rank(self, robots: List, task) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores of every robot plus their availability mask"""
+        if len(robots) <= self.VECTORIZE_MIN_ROBOTS:
+            scores = np.array([self.calculate_robot_rank(robot, task) for robot in robots],
+                              dtype=np.float64)
+            available = np.array([robot.status.value == "Available" for robot in robots],
+                                 dtype=bool)
+            return scores, available
+        
+        # One pass over the robots gathers every field, availability included
+        rx, ry, vel, charge, wt_thr, available = self.snapshot(robots)
+        sx, sy = task.source_x, task.source_y
+        D1 = np.abs(rx - sx) + np.abs(ry - sy)
+        D2 = abs(sx - task.dest_x) + abs(sy - task.dest_y)
+        
+        urgency_multiplier = getattr(task, '_urgency_mul', None)
+        if urgency_multiplier is None:
+            urgency_multiplier = _URGENCY_MULTIPLIERS.get(task.urgency.value, 1.0)
+        
+        speed_factor = (vel / 30.0) * self.alpha
+        energy_factor = (charge / 100.0) * self.beta
+        weight_ok = (wt_thr >= task.item_weight).astype(np.float64)
+        scores = ((speed_factor + energy_factor) / (D1 + D2 + 0.1)) * weight_ok * urgency_multiplier
+        scores[~available] = 0.0
+        return scores, available
+    
+    def find_optimal_robot(self, robots: List, task,
+                           spatial_index: Optional[RobotSpatialIndex] = None
+                           ) -> Tuple[Optional[object], float]:
         """
         Find the best robot for a task using RRA
         
         Args:
             robots: List of robot objects
             task: Task object
+            spatial_index: Index over these robots, used for large fleets
         
         Returns:
             Tuple of (best_robot, best_score)
         """
+        if (spatial_index is not None and SCIPY_AVAILABLE and not self.verbose and
+                len(robots) >= self.SPATIAL_MIN_ROBOTS):
+            return self._select_nearest(robots, task, spatial_index)
+        
+        best_robot, best_score, scores, available = self._select(robots, task)
+        if self.verbose:
+            self._report(robots, task, scores, available, best_robot, best_score)
+        return best_robot, best_score
+    
+    def explain(self, robots: List, task) -> Tuple[Optional[object], float]:
+        """
+        Find the best robot for a task and print the per-robot ranking report
+        
+        Args:
+            robots: List of robot objects
+            task: Task object
+        
+        Returns:
+            Tuple of (best_robot, best_score)
+        """
+        best_robot, best_score, scores, available = self._select(robots, task)
+        self._report(robots, task, scores, available, best_robot, best_score)
+        return best_robot, best_score
+    
+    def _select(self, robots: List, task) -> Tuple[Optional[object], float, np.ndarray, np.ndarray]:
+        """Score every robot and pick the best available one"""
         best_robot = None
         best_score = -1.0
         
+        scores, available = self._rank(robots, task)
+        
+        if available.any():
+            # Ties go to the first robot, as with a strict '>' scan
+            best = int(np.where(available, scores, -np.inf).argmax())
+            best_robot, best_score = robots[best], float(scores[best])
+        
+        return best_robot, best_score, scores, available
+    
+    def _select_nearest(self, robots: List, task,
+                        spatial_index: RobotSpatialIndex) -> Tuple[Optional[object], float]:
+        """
+        Pick the best available robot, scoring only the nearest candidates
+        
+        Candidates are taken nearest-first in growing batches until no robot
+        farther away could reach the best score, so the result matches _select.
+        """
+        spatial_index.refresh(robots)
+        n_available = spatial_index.members.size
+        if n_available == 0:
+            return None, -1.0
+        
+        sx, sy = task.source_x, task.source_y
+        D2 = abs(sx - task.dest_x) + abs(sy - task.dest_y)
+        urgency_multiplier = getattr(task, '_urgency_mul', None)
+        if urgency_multiplier is None:
+            urgency_multiplier = _URGENCY_MULTIPLIERS.get(task.urgency.value, 1.0)
+        best_numerator = ((spatial_index.max_velocity / 30.0) * self.alpha +
+                          (spatial_index.max_charge / 100.0) * self.beta)
+        
+        k = min(self.SPATIAL_CANDIDATES, n_available)
+        while True:
+            distances, candidates = spatial_index.nearest(sx, sy, k)
+            scores = np.array([self.calculate_robot_rank(robots[i], task)
+                               for i in candidates.tolist()], dtype=np.float64)
+            # Ties go to the first robot in the list, as in _select
+            top = scores.max()
+            best = int(candidates[scores == top].min())
+            if k == n_available:
+                break
+            bound = best_numerator / (distances[-1] + D2 + 0.1) * urgency_multiplier
+            if bound < top:
+                break
+            k = min(2 * k, n_available)
+        
+        return robots[best], float(top)
+    
+    @staticmethod
+    def _report(robots: List, task, scores: np.ndarray, available: np.ndarray,
+                best_robot, best_score: float):
+        """Print the ranking table for a task"""
         print(f"\n🔍 Finding optimal robot for Task {task.id} ({task.get_task_name()})")
-        print("=" * 70)
+        print(_RULE)
         
-        scores = []
-        for robot in robots:
-            score = self.calculate_robot_rank(robot, task)
-            status_icon = "✅" if robot.status.value == "Available" else "❌"
-            
-            scores.append((robot, score))
-            
-            print(f"{robot.name}: {status_icon} | "
+        for robot, score, is_available in zip(robots, scores.tolist(), available.tolist()):
+            print(f"{robot.name}: {_STATUS_ICONS[is_available]} | "
                   f"Speed: {robot.velocity:>2} | "
                   f"Charge: {robot.charge_percentage:>5.1f}% | "
                   f"Score: {score:>6.3f}")
-            
-            if score > best_score and robot.status.value == "Available":
-                best_score = score
-                best_robot = robot
         
         if best_robot:
             print(f"\n🎯 Selected Robot: {best_robot.name} (Score: {best_score:.3f})")
         else:
             print("\n❌ No available robots")
         
-        print("=" * 70)
-        
-        return best_robot, best_score
+        print(_RULE)
 
 
 class PathOptimizer:
     """Optimization utilities for paths"""
     
+    # Paths at least this long are scanned with NumPy; shorter ones are
+    # cheaper to walk in Python than to convert to an array
+    VECTORIZE_MIN_LENGTH = 17
+    
+    @staticmethod
+    def _turn_mask(path: List[Tuple[int, int]]) -> np.ndarray:
+        """Boolean mask over path[1:-1], True where the direction changes"""
+        steps = np.diff(np.asarray(path, dtype=np.int32), axis=0)
+        return np.any(steps[1:] != steps[:-1], axis=1)
+    
     @staticmethod
     def calculate_path_cost(path: List[Tuple[int, int]]) -> float:
         """
@@ -322,6 +1253,10 @@ class PathOptimizer:
         if len(path) <= 2:
             return path
         
+        if len(path) >= PathOptimizer.VECTORIZE_MIN_LENGTH:
+            turns = np.flatnonzero(PathOptimizer._turn_mask(path)) + 1
+            return [path[0]] + [path[i] for i in turns.tolist()] + [path[-1]]
+        
         smoothed = [path[0]]
         
         for i in range(1, len(path) - 1):
@@ -340,17 +1275,17 @@ class PathOptimizer:
         return smoothed
     
     @staticmethod
-    def calculate_path_metrics(path: List[Tuple[int, int]]) -> Dict:
+    def calculate_path_metrics(path: Union[np.ndarray, List[Tuple[int, int]]]) -> Dict:
         """
         Calculate various metrics for a path
         
         Args:
-            path: List of positions
+            path: List of positions or an (N, 2) int32 array
         
         Returns:
             Dictionary with metrics
         """
-        if not path:
+        if path is None or len(path) == 0:
             return {
                 'length': 0,
                 'cost': float('inf'),
@@ -365,7 +1300,18 @@ class PathOptimizer:
             'straight_segments': 0
         }
         
-        if len(path) > 2:
+        if len(path) <= 2:
+            return metrics
+        
+        if NUMBA_AVAILABLE:
+            turns = int(_count_turns_nb(np.asarray(path, dtype=np.int32)))
+            metrics['turns'] = turns
+            metrics['straight_segments'] = turns + 1
+        elif len(path) >= PathOptimizer.VECTORIZE_MIN_LENGTH:
+            turns = int(np.count_nonzero(PathOptimizer._turn_mask(path)))
+            metrics['turns'] = turns
+            metrics['straight_segments'] = turns + 1
+        else:
             current_direction = None
             segment_length = 0
             
@@ -391,66 +1337,201 @@ class PathOptimizer:
 class CollisionAvoidance:
     """Collision avoidance and path coordination"""
     
-    def __init__(self):
-        self.reserved_positions = {}  # {position: (robot_id, time)}
-        self.robot_paths = {}  # {robot_id: path}
+    RELEASED = -10**9  # Time stamp marking a released reservation row
+    
+    def __init__(self, capacity: int = 256):
+        # Reservations as parallel arrays, one row per reserved (cell, time) with
+        # the cell stored as its flat index and the robot as its integer uid;
+        # rows [0, _res_n) are in use and released rows are compacted lazily
+        self._res_cell = np.empty(capacity, dtype=np.int32)
+        self._res_time = np.empty(capacity, dtype=np.int64)
+        self._res_robot = np.empty(capacity, dtype=np.int32)
+        self._res_n = 0
+        self._released = 0
+        # Spatio-temporal hash of live reservations, {time * cells + flat index: uid};
+        # conflicting reservations are refused, so every slot has a single owner
+        self._slots = {}
+        self.robot_paths = {}  # {robot_uid: path}
+        self.robot_names = {}  # {robot_uid: robot_id} for display
+        self._uids = {}  # {robot_id: robot_uid} for string callers
+    
+    def register_robot(self, robot_uid: int, robot_id: str):
+        """
+        Associate a robot's integer uid with its string identifier
+        
+        Args:
+            robot_uid: Robot.uid
+            robot_id: Robot.id, used for display and by string-keyed callers
+        """
+        self.robot_names[robot_uid] = robot_id
+        self._uids[robot_id] = robot_uid
+    
+    def _uid(self, robot: Union[int, str]) -> int:
+        """Resolve a robot uid or string id to the uid stored in the arrays"""
+        if isinstance(robot, str):
+            uid = self._uids.get(robot)
+            if uid is None:
+                # Unregistered string ids get negative uids so they never
+                # collide with Robot.uid values
+                uid = -(len(self._uids) + 1)
+                self.register_robot(uid, robot)
+            return uid
+        return robot
+    
+    @property
+    def reserved_positions(self) -> Dict[Tuple[int, int], Tuple[str, int]]:
+        """Live reservations as {position: (robot_id, time)}, latest row winning"""
+        n = self._res_n
+        live = self._res_time[:n] != self.RELEASED
+        names = self.robot_names
+        return {
+            (cell % _W, cell // _W): (names.get(uid, uid), time)
+            for cell, time, uid in zip(self._res_cell[:n][live].tolist(),
+                                       self._res_time[:n][live].tolist(),
+                                       self._res_robot[:n][live].tolist())
+        }
     
-    def reserve_path(self, robot_id: str, path: List[Tuple[int, int]], 
-                    start_time: int = 0) -> bool:
+    def reserve_path(self, robot_uid: Union[int, str],
+                     path: Union[np.ndarray, List[Tuple[int, int]]],
+                     start_time: int = 0) -> bool:
         """
         Reserve positions along a path for a robot
         
         Args:
-            robot_id: Robot identifier
-            path: Path to reserve
+            robot_uid: Robot.uid (a string robot id is also accepted)
+            path: Path to reserve, an (N, 2) int array or a list of (x, y)
             start_time: Starting time
         
         Returns:
             bool: True if reservation successful
         """
-        # Check for conflicts
-        for i, pos in enumerate(path):
-            time = start_time + i
-            if pos in self.reserved_positions:
-                other_robot, other_time = self.reserved_positions[pos]
-                if other_robot != robot_id and abs(time - other_time) < 2:
+        robot_uid = self._uid(robot_uid)
+        path_xy = np.asarray(path, dtype=np.int64).reshape(-1, 2)
+        path_cells = path_xy[:, 1] * _W + path_xy[:, 0]
+        times = start_time + np.arange(len(path_cells), dtype=np.int64)
+        cells = _W * _H
+        keys = (times * cells + path_cells).tolist()
+        
+        # Check for conflicts: same cell held by another robot within one step
+        slots = self._slots
+        for key in keys:
+            for slot in (key - cells, key, key + cells):
+                owner = slots.get(slot)
+                if owner is not None and owner != robot_uid:
                     return False
         
         # Reserve positions
-        for i, pos in enumerate(path):
-            time = start_time + i
-            self.reserved_positions[pos] = (robot_id, time)
-        
-        self.robot_paths[robot_id] = path
+        for key in keys:
+            slots[key] = robot_uid
+        self._append(path_cells, times, robot_uid)
+        self.robot_paths[robot_uid] = path
         return True
     
-    def release_path(self, robot_id: str):
-        """Release reserved path for a robot"""
-        if robot_id in self.robot_paths:
-            path = self.robot_paths[robot_id]
-            for pos in path:
-                if pos in self.reserved_positions:
-                    if self.reserved_positions[pos][0] == robot_id:
-                        del self.reserved_positions[pos]
-            del self.robot_paths[robot_id]
+    def _append(self, path_cells: np.ndarray, times: np.ndarray, robot_uid: int):
+        """Append reservation rows, doubling the buffers when full"""
+        n, count = self._res_n, len(path_cells)
+        if n + count > len(self._res_time):
+            capacity = max(2 * len(self._res_time), n + count)
+            res_cell = np.empty(capacity, dtype=np.int32)
+            res_time = np.empty(capacity, dtype=np.int64)
+            res_robot = np.empty(capacity, dtype=np.int32)
+            res_cell[:n] = self._res_cell[:n]
+            res_time[:n] = self._res_time[:n]
+            res_robot[:n] = self._res_robot[:n]
+            self._res_cell, self._res_time, self._res_robot = res_cell, res_time, res_robot
+        
+        self._res_cell[n:n + count] = path_cells
+        self._res_time[n:n + count] = times
+        self._res_robot[n:n + count] = robot_uid
+        self._res_n = n + count
+    
+    def _compact(self):
+        """Drop released rows from the reservation buffers"""
+        n = self._res_n
+        live = self._res_time[:n] != self.RELEASED
+        count = int(live.sum())
+        self._res_cell[:count] = self._res_cell[:n][live]
+        self._res_time[:count] = self._res_time[:n][live]
+        self._res_robot[:count] = self._res_robot[:n][live]
+        self._res_n = count
+        self._released = 0
+    
+    def release_path(self, robot_uid: Union[int, str]):
+        """Release reserved path for a robot (by uid or string id)"""
+        robot_uid = self._uid(robot_uid)
+        if robot_uid in self.robot_paths:
+            n = self._res_n
+            rows = (self._res_robot[:n] == robot_uid) & (self._res_time[:n] != self.RELEASED)
+            
+            slots, cells = self._slots, _W * _H
+            for key in (self._res_time[:n][rows] * cells + self._res_cell[:n][rows]).tolist():
+                slots.pop(key, None)
+            
+            self._res_time[:n][rows] = self.RELEASED
+            self._released += int(rows.sum())
+            del self.robot_paths[robot_uid]
+            
+            if self._released * 2 > n:
+                self._compact()
+    
+    def conflict_at(self, time: int, x: int, y: int,
+                    exclude_robot: Union[int, str] = None) -> Optional[str]:
+        """
+        Find a robot whose reservation conflicts with occupying (x, y) at a time
+        
+        Uses the same rule as reserve_path: the cell held within one step.
+        
+        Args:
+            time: Simulation time
+            x: X coordinate
+            y: Y coordinate
+            exclude_robot: Robot uid (or string id) to ignore
+        
+        Returns:
+            Robot id holding the cell, or None if it is free
+        """
+        exclude = None if exclude_robot is None else self._uid(exclude_robot)
+        cells = _W * _H
+        key = time * cells + _flat(x, y)
+        for slot in (key - cells, key, key + cells):
+            owner = self._slots.get(slot)
+            if owner is not None and owner != exclude:
+                return self.robot_names.get(owner, owner)
+        return None
     
     def get_dynamic_obstacles(self, current_time: int, 
-                             exclude_robot: str = None) -> List[Tuple[int, int]]:
+                             exclude_robot: Union[int, str] = None) -> List[Tuple[int, int]]:
         """
         Get current dynamic obstacles (other robot positions)
         
         Args:
             current_time: Current simulation time
-            exclude_robot: Robot ID to exclude
+            exclude_robot: Robot uid (or string id) to exclude
         
         Returns:
             List of obstacle positions
         """
-        obstacles = []
-        for pos, (robot_id, time) in self.reserved_positions.items():
-            if robot_id != exclude_robot and abs(time - current_time) < 2:
-                obstacles.append(pos)
-        return obstacles
+        cells = self.get_dynamic_obstacles_flat(current_time, exclude_robot)
+        return [(cell % _W, cell // _W) for cell in cells.tolist()]
+    
+    def get_dynamic_obstacles_flat(self, current_time: int,
+                                   exclude_robot: Union[int, str] = None) -> np.ndarray:
+        """
+        Get current dynamic obstacles as flat grid indices (y * W + x)
+        
+        Args:
+            current_time: Current simulation time
+            exclude_robot: Robot uid (or string id) to exclude
+        
+        Returns:
+            Sorted int32 array of blocked cell indices, ready for the search kernels
+        """
+        n = self._res_n
+        mask = np.abs(self._res_time[:n] - current_time) < 2
+        if exclude_robot is not None:
+            mask &= self._res_robot[:n] != self._uid(exclude_robot)
+        
+        return np.unique(self._res_cell[:n][mask])
 
 
 # Convenience functions for backward compatibility
@@ -460,9 +1541,9 @@ def calculate_robot_rank(robot, task, alpha=0.6, beta=0.4) -> float:
     return rra.calculate_robot_rank(robot, task)
 
 
-def find_optimal_robot(robots: List, task) -> Tuple[Optional[object], float]:
+def find_optimal_robot(robots: List, task, verbose: bool = False) -> Tuple[Optional[object], float]:
     """Legacy function - find optimal robot"""
-    rra = RobotRankingAlgorithm()
+    rra = RobotRankingAlgorithm(verbose=verbose)
     return rra.find_optimal_robot(robots, task)
 
 
@@ -4,8 +4,11 @@ Implements intelligent charging decision system using fuzzy logic
 """
 
 import numpy as np
-from typing import Optional, Dict, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple, Union
 from enum import Enum
+from robot_system import log_event
 
 try:
     import skfuzzy as fuzz
@@ -13,9 +16,167 @@ try:
     FUZZY_AVAILABLE = True
 except ImportError:
     FUZZY_AVAILABLE = False
-    print("⚠️  Warning: scikit-fuzzy library not installed. Using fallback charging system.")
+    print("⚠️  Warning: scikit-fuzzy library not installed. Membership plots disabled.")
     print("   Install with: pip install scikit-fuzzy")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so the kernels below stay importable"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Membership functions as (label, points): 3 points for a triangle, 4 for a
+# trapezoid. Term order matters: the rule table below indexes into it.
+CHARGE_TERMS = (
+    ('critical', (0, 0, 15, 25)),
+    ('low', (15, 30, 45)),
+    ('medium', (35, 50, 65)),
+    ('high', (55, 70, 85)),
+    ('full', (75, 90, 100, 100)),
+)
+VELOCITY_TERMS = (
+    ('slow', (0, 0, 8, 15)),
+    ('medium', (12, 18, 24)),
+    ('fast', (20, 25, 30, 30)),
+)
+WORKLOAD_TERMS = (
+    ('light', (0, 0, 3, 7)),
+    ('moderate', (5, 10, 15)),
+    ('heavy', (12, 17, 20, 20)),
+)
+DISTANCE_TERMS = (
+    ('near', (0, 0, 5, 12)),
+    ('medium', (10, 20, 30)),
+    ('far', (25, 35, 50, 50)),
+)
+PRIORITY_TERMS = (
+    ('very_low', (0, 0, 1, 2)),
+    ('low', (1, 2.5, 4)),
+    ('medium', (3, 5, 7)),
+    ('high', (6, 7.5, 9)),
+    ('critical', (8, 9, 10, 10)),
+)
+
+# Rule base as (charge, velocity, workload, distance, priority) term indices;
+# -1 means the rule does not look at that input
+RULES = np.array([
+    [0, -1, -1, -1, 4],  # critical charge -> critical
+    [1, -1, -1, 2, 4],   # low charge & far from station -> critical
+    [1, -1, 2, -1, 3],   # low charge & heavy workload -> high
+    [1, 0, -1, -1, 3],   # low charge & slow -> high
+    [2, 0, 2, -1, 3],    # medium charge & heavy workload & slow -> high
+    [2, -1, 1, -1, 2],   # medium charge & moderate workload -> medium
+    [2, -1, -1, 0, 2],   # medium charge & near station -> medium
+    [1, 2, 0, -1, 2],    # low charge & light workload & fast -> medium
+    [3, -1, 0, -1, 1],   # high charge & light workload -> low
+    [2, 2, 0, -1, 1],    # medium charge & fast & light workload -> low
+    [3, 2, -1, -1, 1],   # high charge & fast -> low
+    [4, -1, -1, -1, 0],  # full charge -> very low
+    [3, 2, 0, -1, 0],    # high charge & light workload & fast -> very low
+], dtype=np.int8)
+
+
+def _trapezoids(terms) -> np.ndarray:
+    """Membership function points as an (M, 4) array of trapezoids (a, b, c, d)"""
+    return np.array([points if len(points) == 4 else (points[0], points[1], points[1], points[2])
+                     for _, points in terms], dtype=np.float64)
+
+
+# All input terms flattened into one list: their trapezoids, the input each
+# one reads, and the rule table's antecedent columns re-indexed into that list
+# (-1 maps to one extra always-true column)
+_INPUT_TERMS = CHARGE_TERMS + VELOCITY_TERMS + WORKLOAD_TERMS + DISTANCE_TERMS
+_INPUT_TRAPEZOIDS = _trapezoids(_INPUT_TERMS)
+_TERM_INPUT = np.repeat(np.arange(4), [len(CHARGE_TERMS), len(VELOCITY_TERMS),
+                                       len(WORKLOAD_TERMS), len(DISTANCE_TERMS)])
+_RULE_COLUMNS = np.where(RULES[:, :4] >= 0,
+                         RULES[:, :4] + np.searchsorted(_TERM_INPUT, np.arange(4)),
+                         len(_INPUT_TERMS))
+
+
+def _fuzzify(x: np.ndarray, abcd: np.ndarray) -> np.ndarray:
+    """
+    Evaluate trapezoidal membership functions for a batch of inputs
+    
+    Args:
+        x: (N, M) crisp input for each sample and membership function
+        abcd: (M, 4) trapezoids from _trapezoids
+    
+    Returns:
+        (N, M + 1) membership degrees; the extra last column is all ones so
+        that a -1 rule entry selects a neutral element for min()
+    """
+    a, b, c, d = abcd.T
+    rise = np.divide(x - a, b - a, out=(x >= a).astype(np.float64), where=b > a)
+    fall = np.divide(d - x, d - c, out=(x <= d).astype(np.float64), where=d > c)
+    degrees = np.ones((x.shape[0], x.shape[1] + 1))
+    np.clip(np.minimum(rise, fall), 0.0, 1.0, out=degrees[:, :-1])
+    return degrees
+
+
+def _defuzz_centroid(universe: np.ndarray, term_mfs: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+    """
+    Centroid of the max-aggregated, min-clipped output sets for a batch
+    
+    Reproduces scikit-fuzzy's ControlSystem defuzzification: the universe is
+    upsampled with the points where each sampled output set crosses its cut,
+    and the aggregate is integrated piecewise-linearly.
+    
+    Args:
+        universe: (P,) output universe samples
+        term_mfs: (K, P) output membership functions sampled on the universe
+        cuts: (N, K) activation of each output term
+    
+    Returns:
+        (N,) crisp outputs, NaN where no rule fired
+    """
+    n = len(cuts)
+    y = cuts[:, :, None]
+    
+    # Points where each clipped set starts or stops being flat at its cut;
+    # segments without a crossing contribute a duplicate of universe[0]
+    above = np.where(y == 0.0, term_mfs > 0.0, term_mfs >= y)
+    crossing = above[:, :, :-1] != above[:, :, 1:]
+    lo, hi = term_mfs[:, :-1], term_mfs[:, 1:]
+    offset = np.divide((y - lo) * np.diff(universe), hi - lo,
+                       out=np.zeros(crossing.shape), where=crossing)
+    extra = np.where(crossing, universe[:-1] + offset, universe[0]).reshape(n, -1)
+    points = np.sort(np.concatenate([np.broadcast_to(universe, (n, len(universe))), extra],
+                                    axis=1), axis=1)
+    
+    mf = np.zeros_like(points)
+    for k in range(term_mfs.shape[0]):
+        np.maximum(mf, np.minimum(cuts[:, k, None], np.interp(points, universe, term_mfs[k])),
+                   out=mf)
+    
+    # Piecewise-linear centroid: each segment is a rectangle, a triangle or a
+    # trapezoid; zero-width and zero-height segments are skipped
+    x1, x2 = points[:, :-1], points[:, 1:]
+    y1, y2 = mf[:, :-1], mf[:, 1:]
+    width = x2 - x1
+    height = y1 + y2
+    trapezoid = np.divide(2.0 / 3.0 * width * (y2 + 0.5 * y1), height,
+                          out=np.zeros_like(width), where=height > 0.0) + x1
+    shapes = [y1 == y2, y1 == 0.0, y2 == 0.0]
+    moment = np.select(shapes,
+                       [0.5 * (x1 + x2), 2.0 / 3.0 * width + x1, 1.0 / 3.0 * width + x1],
+                       trapezoid)
+    area = np.select(shapes, [width * y1, 0.5 * width * y2, 0.5 * width * y1],
+                     0.5 * width * height)
+    area[((y1 == 0.0) & (y2 == 0.0)) | (width == 0.0)] = 0.0
+    moment = np.where(area > 0.0, moment, 0.0)
+    
+    result = (moment * area).sum(axis=1) / np.fmax(area.sum(axis=1), np.finfo(float).eps)
+    result[mf.sum(axis=1) == 0.0] = np.nan
+    return result
+
 
 class ChargingPriority(Enum):
     """Charging priority levels"""
@@ -25,6 +186,190 @@ class ChargingPriority(Enum):
     LOW = "No Charge"     # No charging needed
 
 
+# Rule-based fallback: charge bands split at these breakpoints, each band's
+# (level, score) indexed by condition bits (1 = velocity below 15,
+# 2 = more than two robots available)
+_FALLBACK_BREAKS = (15, 25, 35, 50, 60, 75)
+_CRITICAL, _HIGH, _MEDIUM, _LOW = (p.value for p in ChargingPriority)
+_FALLBACK_RESULTS = (
+    ((_CRITICAL, 10.0),) * 4,                                           # < 15
+    ((_HIGH, 7.5), (_CRITICAL, 9.0), (_HIGH, 7.5), (_CRITICAL, 9.0)),   # 15-25
+    ((_HIGH, 7.5),) * 4,                                                # 25-35
+    ((_MEDIUM, 4.5), (_MEDIUM, 4.5), (_HIGH, 6.5), (_HIGH, 6.5)),       # 35-50
+    ((_MEDIUM, 4.5),) * 4,                                              # 50-60
+    ((_LOW, 2.5),) * 4,                                                 # 60-75
+    ((_LOW, 1.0),) * 4,                                                 # >= 75
+)
+
+# Recommendation message per priority level, formatted with the score
+_REC_TEMPLATES = {
+    ChargingPriority.CRITICAL.value: "🔴 CRITICAL: Immediate charging required! (Score: {:.1f})",
+    ChargingPriority.HIGH.value: "🟠 HIGH: Schedule charging within 10 minutes (Score: {:.1f})",
+    ChargingPriority.MEDIUM.value: "🟡 MEDIUM: Charging recommended soon (Score: {:.1f})",
+    ChargingPriority.LOW.value: "🟢 LOW: No immediate charging needed (Score: {:.1f})",
+}
+
+
+# Output sets sampled on the integer priority universe, as scikit-fuzzy holds them
+_OUTPUT_UNIVERSE = np.arange(0, 11, 1, dtype=np.float64)
+_OUTPUT_MFS = np.ascontiguousarray(_fuzzify(
+    np.repeat(_OUTPUT_UNIVERSE[:, None], len(PRIORITY_TERMS), axis=1),
+    _trapezoids(PRIORITY_TERMS))[:, :-1].T)
+
+# Input memberships at every integer point of the widest universe, one row per
+# input term plus the always-true column; row m is read at the value of input
+# _LUT_INPUT[m]. Quantized inputs fuzzify with a single gather
+_MEMBERSHIP_LUT = np.ascontiguousarray(_fuzzify(
+    np.repeat(np.arange(0, 101, 1, dtype=np.float64)[:, None], len(_INPUT_TERMS), axis=1),
+    _INPUT_TRAPEZOIDS).T)
+_LUT_ROWS = np.arange(len(_INPUT_TERMS) + 1)
+_LUT_INPUT = np.append(_TERM_INPUT, 0)
+
+
+@njit(cache=True, fastmath=True)
+def _lookup_priority(charge_q, vel_q, wl_q, dist_q):
+    """
+    Compiled priority score for whole-unit inputs, fuzzified from _MEMBERSHIP_LUT
+    
+    Returns:
+        Priority score (0-10), or -1.0 if no rule fires
+    """
+    inputs = (charge_q, vel_q, wl_q, dist_q)
+    degrees = np.empty(_LUT_ROWS.size)
+    for m in range(_LUT_ROWS.size):
+        degrees[m] = _MEMBERSHIP_LUT[m, inputs[_LUT_INPUT[m]]]
+    return _infer_priority(degrees)
+
+
+@njit(cache=True, fastmath=True)
+def _infer_priority(degrees):
+    """
+    Rule table and centroid for one robot's input memberships
+    
+    Args:
+        degrees: Membership of every input term, plus a trailing 1.0 for
+            "don't care" antecedents
+    
+    Returns:
+        Priority score (0-10), or -1.0 if no rule fires
+    """
+    n_out, n_points = _OUTPUT_MFS.shape
+    cuts = np.zeros(n_out)
+    for r in range(RULES.shape[0]):
+        strength = 1.0
+        for i in range(4):
+            strength = min(strength, degrees[_RULE_COLUMNS[r, i]])
+        k = RULES[r, 4]
+        cuts[k] = max(cuts[k], strength)
+    if cuts.max() == 0.0:
+        return -1.0
+    
+    # Upsampled universe: the samples plus each set's crossings of its cut
+    points = np.empty(n_points + n_out * (n_points - 1))
+    points[:n_points] = _OUTPUT_UNIVERSE
+    j = n_points
+    for k in range(n_out):
+        y = cuts[k]
+        for i in range(n_points - 1):
+            lo = _OUTPUT_MFS[k, i]
+            hi = _OUTPUT_MFS[k, i + 1]
+            if y == 0.0:
+                crossing = (lo > 0.0) != (hi > 0.0)
+            else:
+                crossing = (lo >= y) != (hi >= y)
+            if crossing:
+                points[j] = (_OUTPUT_UNIVERSE[i] + (y - lo) *
+                             (_OUTPUT_UNIVERSE[i + 1] - _OUTPUT_UNIVERSE[i]) / (hi - lo))
+            else:
+                points[j] = _OUTPUT_UNIVERSE[0]
+            j += 1
+    points.sort()
+    
+    mf = np.zeros(points.size)
+    for k in range(n_out):
+        clipped = np.minimum(np.interp(points, _OUTPUT_UNIVERSE, _OUTPUT_MFS[k]), cuts[k])
+        mf = np.maximum(mf, clipped)
+    
+    sum_moment_area = 0.0
+    sum_area = 0.0
+    for i in range(1, points.size):
+        x1 = points[i - 1]
+        x2 = points[i]
+        y1 = mf[i - 1]
+        y2 = mf[i]
+        if (y1 == 0.0 and y2 == 0.0) or x1 == x2:
+            continue
+        if y1 == y2:
+            moment = 0.5 * (x1 + x2)
+            area = (x2 - x1) * y1
+        elif y1 == 0.0:
+            moment = 2.0 / 3.0 * (x2 - x1) + x1
+            area = 0.5 * (x2 - x1) * y2
+        elif y2 == 0.0:
+            moment = 1.0 / 3.0 * (x2 - x1) + x1
+            area = 0.5 * (x2 - x1) * y1
+        else:
+            moment = (2.0 / 3.0 * (x2 - x1) * (y2 + 0.5 * y1)) / (y1 + y2) + x1
+            area = 0.5 * (x2 - x1) * (y1 + y2)
+        sum_moment_area += moment * area
+        sum_area += area
+    
+    return sum_moment_area / max(sum_area, np.finfo(np.float64).eps)
+
+
+def _evaluate_batch(charges, velocities, workloads, distances) -> np.ndarray:
+    """
+    NumPy evaluation of the rule base, see FuzzyChargingSystem.get_charging_priority_batch
+    """
+    inputs = np.stack(np.broadcast_arrays(charges, velocities, workloads, distances),
+                      axis=-1).reshape(-1, 4).astype(np.float64)
+    np.clip(inputs, 0, (100, 30, 20, 50), out=inputs)
+    return _infer_batch(_fuzzify(inputs[:, _TERM_INPUT], _INPUT_TRAPEZOIDS))
+
+
+def _infer_batch(degrees: np.ndarray) -> np.ndarray:
+    """
+    Rule table and centroid for (N, M+1) input memberships, NaN where no rule fires
+    """
+    # Rule strength is the min over its antecedents (AND); each output
+    # term takes the max over the rules that conclude it (OR)
+    strength = degrees[:, _RULE_COLUMNS].min(axis=2)
+    cuts = np.zeros((len(strength), len(PRIORITY_TERMS)))
+    for k in range(len(PRIORITY_TERMS)):
+        cuts[:, k] = strength[:, RULES[:, 4] == k].max(axis=1)
+    
+    return _defuzz_centroid(_OUTPUT_UNIVERSE, _OUTPUT_MFS, cuts)
+
+
+@lru_cache(maxsize=4096)
+def _cached_priority(charge_q: int, vel_q: int, wl_q: int, dist_q: int) -> float:
+    """
+    Priority score for quantized inputs, memoized
+    
+    Charge, velocity and workload drift slowly between frames, so whole-unit
+    inputs repeat constantly and most calls become a dict lookup.
+    
+    Returns:
+        Priority score (0-10), NaN if no rule fires
+    """
+    if NUMBA_AVAILABLE:
+        score = _lookup_priority(charge_q, vel_q, wl_q, dist_q)
+        return float('nan') if score < 0.0 else score
+    inputs = np.array((charge_q, vel_q, wl_q, dist_q))
+    return float(_infer_batch(_MEMBERSHIP_LUT[_LUT_ROWS, inputs[_LUT_INPUT]][None])[0])
+
+
+def _score_to_level(priority_score: float) -> str:
+    """Map a fuzzy priority score (0-10) to a ChargingPriority value"""
+    if priority_score >= 8.5:
+        return ChargingPriority.CRITICAL.value
+    elif priority_score >= 6.0:
+        return ChargingPriority.HIGH.value
+    elif priority_score >= 3.5:
+        return ChargingPriority.MEDIUM.value
+    return ChargingPriority.LOW.value
+
+
 class FuzzyChargingSystem:
     """
     Fuzzy Logic-based charging decision system
@@ -32,21 +377,19 @@ class FuzzyChargingSystem:
     """
     
     def __init__(self):
-        self.available = FUZZY_AVAILABLE
-        
-        if not FUZZY_AVAILABLE:
-            print("   Using fallback rule-based charging system")
-            return
-        
-        try:
-            self._initialize_fuzzy_system()
-            print("✅ Fuzzy charging system initialized successfully")
-        except Exception as e:
-            print(f"⚠️  Error initializing fuzzy system: {e}")
-            self.available = False
+        # The rule base is evaluated with NumPy; scikit-fuzzy only backs the plots
+        self.charge = None
+        
+        if FUZZY_AVAILABLE:
+            try:
+                self._initialize_fuzzy_system()
+            except Exception as e:
+                print(f"⚠️  Error building membership plots: {e}")
+                self.charge = None
+        print("✅ Fuzzy charging system initialized successfully")
     
     def _initialize_fuzzy_system(self):
-        """Initialize fuzzy logic variables and rules"""
+        """Initialize the scikit-fuzzy variables drawn by visualize_membership_functions"""
         
         # Define fuzzy input variables
         self.charge = ctrl.Antecedent(np.arange(0, 101, 1), 'charge')
@@ -57,162 +400,160 @@ class FuzzyChargingSystem:
         # Define fuzzy output variable
         self.charge_priority = ctrl.Consequent(np.arange(0, 11, 1), 'priority')
         
-        # Charge level membership functions
-        self.charge['critical'] = fuzz.trapmf(self.charge.universe, [0, 0, 15, 25])
-        self.charge['low'] = fuzz.trimf(self.charge.universe, [15, 30, 45])
-        self.charge['medium'] = fuzz.trimf(self.charge.universe, [35, 50, 65])
-        self.charge['high'] = fuzz.trimf(self.charge.universe, [55, 70, 85])
-        self.charge['full'] = fuzz.trapmf(self.charge.universe, [75, 90, 100, 100])
-        
-        # Velocity membership functions
-        self.velocity['slow'] = fuzz.trapmf(self.velocity.universe, [0, 0, 8, 15])
-        self.velocity['medium'] = fuzz.trimf(self.velocity.universe, [12, 18, 24])
-        self.velocity['fast'] = fuzz.trapmf(self.velocity.universe, [20, 25, 30, 30])
-        
-        # Workload membership functions
-        self.workload['light'] = fuzz.trapmf(self.workload.universe, [0, 0, 3, 7])
-        self.workload['moderate'] = fuzz.trimf(self.workload.universe, [5, 10, 15])
-        self.workload['heavy'] = fuzz.trapmf(self.workload.universe, [12, 17, 20, 20])
-        
-        # Distance to charging station membership functions
-        self.distance_to_station['near'] = fuzz.trapmf(self.distance_to_station.universe, [0, 0, 5, 12])
-        self.distance_to_station['medium'] = fuzz.trimf(self.distance_to_station.universe, [10, 20, 30])
-        self.distance_to_station['far'] = fuzz.trapmf(self.distance_to_station.universe, [25, 35, 50, 50])
-        
-        # Priority output membership functions
-        self.charge_priority['very_low'] = fuzz.trapmf(self.charge_priority.universe, [0, 0, 1, 2])
-        self.charge_priority['low'] = fuzz.trimf(self.charge_priority.universe, [1, 2.5, 4])
-        self.charge_priority['medium'] = fuzz.trimf(self.charge_priority.universe, [3, 5, 7])
-        self.charge_priority['high'] = fuzz.trimf(self.charge_priority.universe, [6, 7.5, 9])
-        self.charge_priority['critical'] = fuzz.trapmf(self.charge_priority.universe, [8, 9, 10, 10])
-        
-        # Define fuzzy rules
-        self.rules = self._create_fuzzy_rules()
-        
-        # Create control system
-        self.charging_ctrl = ctrl.ControlSystem(self.rules)
-        self.charging_system = ctrl.ControlSystemSimulation(self.charging_ctrl)
-    
-    def _create_fuzzy_rules(self):
-        """Create comprehensive fuzzy rule set"""
-        rules = []
-        
-        # Critical charge rules (highest priority)
-        rules.append(ctrl.Rule(
-            self.charge['critical'],
-            self.charge_priority['critical']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['low'] & self.distance_to_station['far'],
-            self.charge_priority['critical']
-        ))
-        
-        # High priority rules
-        rules.append(ctrl.Rule(
-            self.charge['low'] & self.workload['heavy'],
-            self.charge_priority['high']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['low'] & self.velocity['slow'],
-            self.charge_priority['high']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['medium'] & self.workload['heavy'] & self.velocity['slow'],
-            self.charge_priority['high']
-        ))
-        
-        # Medium priority rules
-        rules.append(ctrl.Rule(
-            self.charge['medium'] & self.workload['moderate'],
-            self.charge_priority['medium']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['medium'] & self.distance_to_station['near'],
-            self.charge_priority['medium']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['low'] & self.workload['light'] & self.velocity['fast'],
-            self.charge_priority['medium']
-        ))
-        
-        # Low priority rules
-        rules.append(ctrl.Rule(
-            self.charge['high'] & self.workload['light'],
-            self.charge_priority['low']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['medium'] & self.velocity['fast'] & self.workload['light'],
-            self.charge_priority['low']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['high'] & self.velocity['fast'],
-            self.charge_priority['low']
-        ))
-        
-        # Very low priority rules
-        rules.append(ctrl.Rule(
-            self.charge['full'],
-            self.charge_priority['very_low']
-        ))
-        
-        rules.append(ctrl.Rule(
-            self.charge['high'] & self.workload['light'] & self.velocity['fast'],
-            self.charge_priority['very_low']
-        ))
-        
-        return rules
+        # Membership functions for the inputs (charge level, velocity, workload,
+        # distance to charging station) and the priority output
+        for variable, terms in ((self.charge, CHARGE_TERMS),
+                                (self.velocity, VELOCITY_TERMS),
+                                (self.workload, WORKLOAD_TERMS),
+                                (self.distance_to_station, DISTANCE_TERMS),
+                                (self.charge_priority, PRIORITY_TERMS)):
+            for label, points in terms:
+                mf = fuzz.trimf if len(points) == 3 else fuzz.trapmf
+                variable[label] = mf(variable.universe, list(points))
     
-    def get_charging_priority(self, robot, available_robots_count: int, 
-                            distance_to_station: float = 5.0) -> Tuple[str, float, Dict]:
+    @staticmethod
+    def invalidate_cache():
         """
-        Determine charging priority for a robot
+        Drop memoized priority scores
+        
+        Call this after changing the membership functions or the rule table.
+        """
+        _cached_priority.cache_clear()
+    
+    @staticmethod
+    def warm_up():
+        """
+        Compile (or load from numba's disk cache) the priority kernel ahead of time
+        
+        Calls the kernel directly, so the priority memo stays empty. Does
+        nothing without numba.
+        """
+        if not NUMBA_AVAILABLE:
+            return
+        _lookup_priority(0, 0, 0, 0)
+    
+    def get_charging_priority_batch(self, charges, velocities, workloads,
+                                    distances) -> np.ndarray:
+        """
+        Evaluate the fuzzy rule base for many robots at once
         
         Args:
-            robot: Robot object
+            charges: Charge percentages
+            velocities: Robot velocities
+            workloads: Completed task counts
+            distances: Distances to the nearest charging station
+        
+        Returns:
+            Array of priority scores (0-10), NaN where no rule fires
+        """
+        return _evaluate_batch(charges, velocities, workloads, distances)
+    
+    def get_charging_priorities(self, robots, available_robots_count: int,
+                                distances_to_station=5.0) -> List[Tuple[str, float]]:
+        """
+        Determine charging priority for every robot with one batch evaluation
+        
+        Args:
+            robots: Robot objects
             available_robots_count: Number of available robots
-            distance_to_station: Distance to nearest charging station
+            distances_to_station: Distance to the nearest charging station,
+                per robot or one value for all
         
         Returns:
-            Tuple of (priority_level, priority_score, details)
+            List of (priority_level, priority_score), in robot order
         """
-        if not self.available:
-            return self._fallback_charging_decision(robot, available_robots_count)
+        scores = self.get_charging_priority_batch(
+            [robot.charge_percentage for robot in robots],
+            [robot.velocity for robot in robots],
+            [robot.completed_tasks for robot in robots],
+            distances_to_station)
+        
+        priorities = []
+        for robot, score in zip(robots, scores.tolist()):
+            if np.isnan(score):
+                log_event(f"⚠️  Fuzzy system error: no rule fired for {robot.name}. "
+                          f"Using fallback system.")
+                priorities.append(self._fallback_priority(robot, available_robots_count))
+            else:
+                priorities.append((_score_to_level(score), score))
+        return priorities
+    
+    def _evaluate(self, robot, available_robots_count: int,
+                  distance_to_station: float) -> Tuple[str, float, Optional[Tuple]]:
+        """
+        Shared core of get_charging_priority and get_charging_priority_fast
         
+        Returns:
+            Tuple of (priority_level, priority_score, inputs), where inputs are
+            the clipped (charge, velocity, workload, distance) the fuzzy system
+            used, or None if the rule-based fallback decided
+        """
         try:
             # Prepare inputs
             charge_level = max(0, min(100, robot.charge_percentage))
             velocity = max(0, min(30, robot.velocity))
-            workload = max(0, min(20, getattr(robot, 'completed_tasks', 0)))
+            workload = max(0, min(20, robot.completed_tasks))
             distance = max(0, min(50, distance_to_station))
             
-            # Set fuzzy system inputs
-            self.charging_system.input['charge'] = charge_level
-            self.charging_system.input['velocity'] = velocity
-            self.charging_system.input['workload'] = workload
-            self.charging_system.input['distance'] = distance
-            
-            # Compute result
-            self.charging_system.compute()
-            priority_score = self.charging_system.output['priority']
+            # Compute result on inputs rounded to whole units; the categorical
+            # level barely moves within a unit, and the memo absorbs repeat calls
+            priority_score = _cached_priority(round(charge_level), round(velocity),
+                                              round(workload), round(distance))
+            if np.isnan(priority_score):
+                raise ValueError("Crisp output cannot be calculated: no rule fired "
+                                 "for these inputs")
             
             # Convert score to priority level
-            if priority_score >= 8.5:
-                priority_level = ChargingPriority.CRITICAL.value
-            elif priority_score >= 6.0:
-                priority_level = ChargingPriority.HIGH.value
-            elif priority_score >= 3.5:
-                priority_level = ChargingPriority.MEDIUM.value
-            else:
-                priority_level = ChargingPriority.LOW.value
+            level = _score_to_level(priority_score)
+            return level, priority_score, (charge_level, velocity, workload, distance)
             
-            # Additional details
+        except Exception as e:
+            print(f"⚠️  Fuzzy system error: {e}. Using fallback system.")
+            return self._fallback_priority(robot, available_robots_count) + (None,)
+    
+    def get_charging_priority_fast(self, robot, available_robots_count: int,
+                                   distance_to_station: float = 5.0) -> Tuple[str, float]:
+        """
+        Determine charging priority for a robot without building the details dict
+        
+        Args:
+            robot: Robot object
+            available_robots_count: Number of available robots
+            distance_to_station: Distance to nearest charging station
+        
+        Returns:
+            Tuple of (priority_level, priority_score)
+        """
+        level, score, _ = self._evaluate(robot, available_robots_count, distance_to_station)
+        return level, score
+    
+    def get_charging_priority(self, robot, available_robots_count: int, 
+                            distance_to_station: float = 5.0,
+                            return_details: bool = True) -> Union[Tuple[str, float, Dict],
+                                                                  Tuple[str, float]]:
+        """
+        Determine charging priority for a robot
+        
+        Args:
+            robot: Robot object
+            available_robots_count: Number of available robots
+            distance_to_station: Distance to nearest charging station
+            return_details: Include the details dict; False behaves like
+                get_charging_priority_fast
+        
+        Returns:
+            Tuple of (priority_level, priority_score, details), or
+            (priority_level, priority_score) when return_details is False
+        """
+        level, priority_score, inputs = self._evaluate(robot, available_robots_count,
+                                                       distance_to_station)
+        if not return_details:
+            return level, priority_score
+        
+        if inputs is None:
+            details = self._fallback_details(robot, available_robots_count, priority_score)
+        else:
+            charge_level, velocity, workload, distance = inputs
             details = {
                 'priority_score': round(priority_score, 2),
                 'charge_level': charge_level,
@@ -222,12 +563,8 @@ class FuzzyChargingSystem:
                 'available_robots': available_robots_count,
                 'decision_method': 'fuzzy_logic'
             }
-            
-            return priority_level, priority_score, details
-            
-        except Exception as e:
-            print(f"⚠️  Fuzzy system error: {e}. Using fallback system.")
-            return self._fallback_charging_decision(robot, available_robots_count)
+        
+        return level, priority_score, details
     
     def _fallback_charging_decision(self, robot, available_robots_count: int) -> Tuple[str, float, Dict]:
         """
@@ -240,41 +577,32 @@ class FuzzyChargingSystem:
         Returns:
             Tuple of (priority_level, priority_score, details)
         """
-        charge = robot.charge_percentage
-        velocity = robot.velocity
-        
+        priority_level, priority_score = self._fallback_priority(robot, available_robots_count)
+        details = self._fallback_details(robot, available_robots_count, priority_score)
+        return priority_level, priority_score, details
+    
+    def _fallback_priority(self, robot, available_robots_count: int) -> Tuple[str, float]:
+        """
+        Rule-based priority level and score, see _fallback_charging_decision
+        """
         # Simple rule-based decision
-        if charge < 15:
-            priority_level = ChargingPriority.CRITICAL.value
-            priority_score = 10.0
-        elif charge < 25 and velocity < 15:
-            priority_level = ChargingPriority.CRITICAL.value
-            priority_score = 9.0
-        elif charge < 35:
-            priority_level = ChargingPriority.HIGH.value
-            priority_score = 7.5
-        elif charge < 50 and available_robots_count > 2:
-            priority_level = ChargingPriority.HIGH.value
-            priority_score = 6.5
-        elif charge < 60:
-            priority_level = ChargingPriority.MEDIUM.value
-            priority_score = 4.5
-        elif charge < 75:
-            priority_level = ChargingPriority.LOW.value
-            priority_score = 2.5
-        else:
-            priority_level = ChargingPriority.LOW.value
-            priority_score = 1.0
+        conditions = (robot.velocity < 15) | ((available_robots_count > 2) << 1)
+        priority_level, priority_score = _FALLBACK_RESULTS[
+            bisect_right(_FALLBACK_BREAKS, robot.charge_percentage)][conditions]
         
-        details = {
+        return priority_level, priority_score
+    
+    def _fallback_details(self, robot, available_robots_count: int, priority_score: float) -> Dict:
+        """
+        Details dict reported alongside a rule-based decision
+        """
+        return {
             'priority_score': priority_score,
-            'charge_level': charge,
-            'velocity': velocity,
+            'charge_level': robot.charge_percentage,
+            'velocity': robot.velocity,
             'available_robots': available_robots_count,
             'decision_method': 'rule_based_fallback'
         }
-        
-        return priority_level, priority_score, details
     
     def get_charging_recommendation(self, robot, available_robots_count: int) -> str:
         """
@@ -287,25 +615,15 @@ class FuzzyChargingSystem:
         Returns:
             str: Charging recommendation message
         """
-        priority, score, details = self.get_charging_priority(robot, available_robots_count)
-        
-        recommendations = {
-            ChargingPriority.CRITICAL.value: 
-                f"🔴 CRITICAL: Immediate charging required! (Score: {score:.1f})",
-            ChargingPriority.HIGH.value: 
-                f"🟠 HIGH: Schedule charging within 10 minutes (Score: {score:.1f})",
-            ChargingPriority.MEDIUM.value: 
-                f"🟡 MEDIUM: Charging recommended soon (Score: {score:.1f})",
-            ChargingPriority.LOW.value: 
-                f"🟢 LOW: No immediate charging needed (Score: {score:.1f})"
-        }
+        priority, score = self.get_charging_priority_fast(robot, available_robots_count)
         
-        return recommendations.get(priority, f"Unknown priority: {priority}")
+        template = _REC_TEMPLATES.get(priority)
+        return template.format(score) if template else f"Unknown priority: {priority}"
     
     def visualize_membership_functions(self):
         """Visualize fuzzy membership functions (requires matplotlib)"""
-        if not self.available:
-            print("Fuzzy system not available")
+        if self.charge is None:
+            print("scikit-fuzzy not available for visualization")
             return
         
         try:
@@ -340,6 +658,12 @@ class FuzzyChargingSystem:
 
 
 # Convenience function for backward compatibility
+@lru_cache(maxsize=1)
+def _shared_system() -> FuzzyChargingSystem:
+    """Process-wide FuzzyChargingSystem, built on first use"""
+    return FuzzyChargingSystem()
+
+
 def simple_charging_check(robot, available_robots_count: int) -> str:
     """
     Simple charging check (legacy function)
@@ -351,8 +675,7 @@ def simple_charging_check(robot, available_robots_count: int) -> str:
     Returns:
         str: Charging priority level
     """
-    fuzzy_system = FuzzyChargingSystem()
-    priority, _, _ = fuzzy_system.get_charging_priority(robot, available_robots_count)
+    priority, _ = _shared_system().get_charging_priority_fast(robot, available_robots_count)
     return priority
 
 
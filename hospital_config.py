@@ -3,6 +3,18 @@ Hospital Configuration Module
 Defines the hospital map layout, colors, grid settings, and utility functions
 """
 
+import numpy as np
+from typing import NamedTuple, Tuple
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so the kernels below stay importable"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Factory Map Layout - FULLY OPEN VERSION (All Paths Clear)
 # Legend:
 # '#' = Wall
@@ -35,48 +47,67 @@ FACTORY_MAP = [
 # Keep backward compatibility
 HOSPITAL_MAP = FACTORY_MAP
 
+# Walkability bitmap of the map, shape (height, width); True = floor
+WALKABLE = np.array([[cell not in '#O' for cell in row] for row in HOSPITAL_MAP], dtype=np.bool_)
+
+# Nested-list copy for scalar lookups, which are faster on lists than on NumPy arrays
+_WALKABLE_ROWS = WALKABLE.tolist()
+
+# 4-directional neighbor offsets: down, up, right, left
+_NEIGHBOR_OFFSETS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
 # Enhanced Color Palette
-COLORS = {
+RGB = Tuple[int, int, int]
+
+class Colors(NamedTuple):
+    """Named colors; fields are read as attributes (PALETTE.wall)"""
     # Environment colors
-    'wall': (70, 70, 85),           # Dark gray walls
-    'floor': (248, 248, 252),       # Light floor
-    'obstacle': (220, 120, 100),    # Orange-red obstacles
-    'source': (80, 200, 120),       # Green source
-    'destination': (100, 130, 220), # Blue destination
+    wall: RGB = (70, 70, 85)           # Dark gray walls
+    floor: RGB = (248, 248, 252)       # Light floor
+    obstacle: RGB = (220, 120, 100)    # Orange-red obstacles
+    source: RGB = (80, 200, 120)       # Green source
+    destination: RGB = (100, 130, 220)  # Blue destination
     
     # Robot colors (vibrant and distinct)
-    'robot_R1': (255, 70, 70),      # Bright red
-    'robot_R2': (70, 220, 70),      # Bright green
-    'robot_R3': (70, 150, 255),     # Bright blue
-    'robot_R4': (255, 200, 50),     # Golden yellow
+    robot_R1: RGB = (255, 70, 70)      # Bright red
+    robot_R2: RGB = (70, 220, 70)      # Bright green
+    robot_R3: RGB = (70, 150, 255)     # Bright blue
+    robot_R4: RGB = (255, 200, 50)     # Golden yellow
     
     # Path and UI colors
-    'path': (255, 160, 80),         # Orange path
-    'path_secondary': (150, 200, 255), # Light blue alternative path
-    'text': (30, 30, 40),           # Dark text
-    'text_light': (255, 255, 255),  # White text
+    path: RGB = (255, 160, 80)         # Orange path
+    path_secondary: RGB = (150, 200, 255)  # Light blue alternative path
+    text: RGB = (30, 30, 40)           # Dark text
+    text_light: RGB = (255, 255, 255)  # White text
     
     # Status colors
-    'status_available': (80, 200, 120),   # Green
-    'status_busy': (255, 100, 100),       # Red
-    'status_charging': (255, 200, 50),    # Yellow
+    status_available: RGB = (80, 200, 120)   # Green
+    status_busy: RGB = (255, 100, 100)       # Red
+    status_charging: RGB = (255, 200, 50)    # Yellow
     
     # Battery colors
-    'battery_high': (80, 220, 100),       # Green (>60%)
-    'battery_medium': (255, 200, 50),     # Yellow (30-60%)
-    'battery_low': (255, 80, 80),         # Red (<30%)
-    'battery_outline': (100, 100, 120),   # Gray outline
+    battery_high: RGB = (80, 220, 100)       # Green (>60%)
+    battery_medium: RGB = (255, 200, 50)     # Yellow (30-60%)
+    battery_low: RGB = (255, 80, 80)         # Red (<30%)
+    battery_outline: RGB = (100, 100, 120)   # Gray outline
     
     # Dashboard colors
-    'dashboard_bg': (245, 245, 250),      # Light gray background
-    'dashboard_border': (100, 100, 120),  # Border
-    'highlight': (100, 180, 255),         # Highlight blue
-}
+    dashboard_bg: RGB = (245, 245, 250)      # Light gray background
+    dashboard_border: RGB = (100, 100, 120)  # Border
+    highlight: RGB = (100, 180, 255)         # Highlight blue
+
+
+PALETTE = Colors()
+
+# Name-keyed view of PALETTE (backward compatibility)
+COLORS = PALETTE._asdict()
 
 # Grid Configuration
+MAP_WIDTH = len(HOSPITAL_MAP[0])                    # Map width in cells
+MAP_HEIGHT = len(HOSPITAL_MAP)                      # Map height in cells
 GRID_SIZE = 40                                      # Size of each grid cell in pixels
-SCREEN_WIDTH = len(HOSPITAL_MAP[0]) * GRID_SIZE    # Total screen width
-SCREEN_HEIGHT = len(HOSPITAL_MAP) * GRID_SIZE      # Total screen height
+SCREEN_WIDTH = MAP_WIDTH * GRID_SIZE                # Total screen width
+SCREEN_HEIGHT = MAP_HEIGHT * GRID_SIZE              # Total screen height
 
 # Animation Settings
 ANIMATION_SPEED = 2          # Speed of animations
@@ -84,32 +115,26 @@ FPS = 60                     # Frames per second
 PATH_ANIMATION_DELAY = 4     # Delay between path animation frames
 
 # Robot Configuration
-ROBOT_CONFIGS = {
-    'R1': {
-        'name': 'CargoBot-1',
-        'color': COLORS['robot_R1'],
-        'initial_charge': 100,
-        'speed': 1.0
-    },
-    'R2': {
-        'name': 'CargoBot-2',
-        'color': COLORS['robot_R2'],
-        'initial_charge': 100,
-        'speed': 1.0
-    },
-    'R3': {
-        'name': 'CargoBot-3',
-        'color': COLORS['robot_R3'],
-        'initial_charge': 100,
-        'speed': 1.0
-    },
-    'R4': {
-        'name': 'CargoBot-4',
-        'color': COLORS['robot_R4'],
-        'initial_charge': 100,
-        'speed': 1.0
-    }
-}
+class RobotConfig(NamedTuple):
+    """Static configuration of one robot"""
+    name: str
+    color: RGB
+    initial_charge: int
+    speed: float
+
+
+# Robot configs indexed by position; ROBOT_INDEX maps robot ids to positions
+ROBOT_CONFIG_LIST = (
+    RobotConfig('CargoBot-1', PALETTE.robot_R1, 100, 1.0),
+    RobotConfig('CargoBot-2', PALETTE.robot_R2, 100, 1.0),
+    RobotConfig('CargoBot-3', PALETTE.robot_R3, 100, 1.0),
+    RobotConfig('CargoBot-4', PALETTE.robot_R4, 100, 1.0),
+)
+ROBOT_INDEX = {'R1': 0, 'R2': 1, 'R3': 2, 'R4': 3}
+
+# Id-keyed dict view of ROBOT_CONFIG_LIST (backward compatibility)
+ROBOT_CONFIGS = {robot_id: ROBOT_CONFIG_LIST[index]._asdict()
+                 for robot_id, index in ROBOT_INDEX.items()}
 
 # Task Types Configuration
 TASK_TYPES = {
@@ -140,12 +165,13 @@ TASK_TYPES = {
     }
 }
 
-def get_map_positions():
+def _scan_map():
     """
     Extract positions of all elements from the hospital map
     
     Returns:
-        dict: Dictionary containing positions of robots, obstacles, source, and destination
+        dict: Dictionary containing positions of robots, obstacles, source, and destination;
+            obstacles and walls are (N, 2) int16 arrays of (x, y) rows
     """
     positions = {
         'robots': {},
@@ -180,8 +206,41 @@ def get_map_positions():
             elif cell == '#':
                 positions['walls'].append((x, y))
     
+    # Compact read-only (N, 2) arrays for the cell lists
+    for key in ('obstacles', 'walls'):
+        cells = np.asarray(positions[key], dtype=np.int16).reshape(-1, 2)
+        cells.setflags(write=False)
+        positions[key] = cells
+    
     return positions
 
+# The map is constant, so it is scanned once at import
+_MAP_POSITIONS = _scan_map()
+
+def get_map_positions():
+    """
+    Get positions of all elements from the hospital map
+    
+    The result is shared between callers and must not be modified. `in` on
+    the obstacle array tests elementwise; use obstacle_set() for membership.
+    
+    Returns:
+        dict: Dictionary containing positions of robots, obstacles, source, and destination;
+            obstacles and walls are (N, 2) int16 arrays of (x, y) rows
+    """
+    return _MAP_POSITIONS
+
+_OBSTACLE_SET = frozenset(map(tuple, _MAP_POSITIONS['obstacles'].tolist()))
+
+def obstacle_set():
+    """
+    Get the map's obstacle positions as a set
+    
+    Returns:
+        frozenset: (x, y) tuples of all obstacle cells
+    """
+    return _OBSTACLE_SET
+
 def is_walkable(x, y):
     """
     Check if a position is walkable (not a wall or obstacle)
@@ -193,11 +252,7 @@ def is_walkable(x, y):
     Returns:
         bool: True if position is walkable, False otherwise
     """
-    if y < 0 or y >= len(HOSPITAL_MAP) or x < 0 or x >= len(HOSPITAL_MAP[0]):
-        return False
-    
-    cell = HOSPITAL_MAP[y][x]
-    return cell not in ['#', 'O']
+    return 0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT and _WALKABLE_ROWS[y][x]
 
 def get_neighbors(x, y):
     """
@@ -210,15 +265,12 @@ def get_neighbors(x, y):
     Returns:
         list: List of (x, y) tuples for walkable neighbors
     """
-    neighbors = []
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # Down, Up, Right, Left
-    
-    for dx, dy in directions:
-        new_x, new_y = x + dx, y + dy
-        if is_walkable(new_x, new_y):
-            neighbors.append((new_x, new_y))
-    
-    return neighbors
+    return [(x + dx, y + dy) for dx, dy in _NEIGHBOR_OFFSETS if is_walkable(x + dx, y + dy)]
+
+@njit(cache=True, fastmath=True, inline='always')
+def _manhattan(x1, y1, x2, y2):
+    """Manhattan distance on scalar coordinates, for use inside compiled kernels"""
+    return abs(x1 - x2) + abs(y1 - y2)
 
 def manhattan_distance(pos1, pos2):
     """
@@ -246,14 +298,18 @@ def euclidean_distance(pos1, pos2):
     """
     return ((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)**0.5
 
-def validate_map():
+def validate_map(positions=None):
     """
     Validate the hospital map configuration
     
+    Args:
+        positions (dict, optional): Map positions to check; defaults to get_map_positions()
+    
     Returns:
         tuple: (bool, str) - (is_valid, error_message)
     """
-    positions = get_map_positions()
+    if positions is None:
+        positions = get_map_positions()
     
     # Check if source exists
     if positions['source'] is None:
@@ -275,12 +331,12 @@ def validate_map():
     return True, "Map configuration is valid"
 
 # Validate map on module import
-_is_valid, _error_msg = validate_map()
+_is_valid, _error_msg = validate_map(_MAP_POSITIONS)
 if not _is_valid:
     print(f"⚠️  Warning: {_error_msg}")
 else:
     print(f"✅ Hospital map configuration loaded successfully")
-    print(f"   - Map size: {len(HOSPITAL_MAP[0])}x{len(HOSPITAL_MAP)} cells")
+    print(f"   - Map size: {MAP_WIDTH}x{MAP_HEIGHT} cells")
     print(f"   - Screen size: {SCREEN_WIDTH}x{SCREEN_HEIGHT} pixels")
-    print(f"   - Robots: {len(get_map_positions()['robots'])}")
-    print(f"   - Obstacles: {len(get_map_positions()['obstacles'])}")
\ No newline at end of file
+    print(f"   - Robots: {len(_MAP_POSITIONS['robots'])}")
+    print(f"   - Obstacles: {len(_MAP_POSITIONS['obstacles'])}")
\ No newline at end of file
@@ -4,15 +4,22 @@ Orchestrates the complete autonomous robot system for hospital logistics
 """
 
 import pygame
+import numpy as np
 import sys
 import time
+import heapq
+import itertools
+from collections import Counter
 from typing import List, Optional, Tuple, Dict
 from datetime import datetime
 
 from hospital_config import get_map_positions, ROBOT_CONFIGS, TASK_TYPES
-from robot_system import Robot, Task, TaskUrgency, RobotStatus, TaskStatus
+from robot_system import (
+    Robot, Task, TaskTemplate, TaskUrgency, RobotStatus, TaskStatus, EVENT_LOG
+)
 from algorithms import (
-    find_optimal_robot, 
+    RobotRankingAlgorithm,
+    RobotSpatialIndex,
     a_star_pathfinding, 
     PathfindingAlgorithms,
     PathOptimizer,
@@ -22,6 +29,22 @@ from fuzzy_logic import FuzzyChargingSystem, simple_charging_check, BatteryManag
 from visualization import HospitalVisualization
 
 
+# Demonstration tasks, instantiated once and reset in place on each restart
+SAMPLE_TASK_TEMPLATES: Tuple[TaskTemplate, ...] = (
+    TaskTemplate((1, 13), (12, 13), TaskUrgency.EMERGENCY, 3, 'parts',  # Changed to valid position
+                 'Emergency parts delivery to assembly line'),
+    TaskTemplate((1, 13), (7, 7), TaskUrgency.NORMAL, 8, 'materials',  # Center position
+                 'Raw materials to production area'),
+    TaskTemplate((1, 13), (12, 3), TaskUrgency.URGENT, 2, 'tools',  # Top right area
+                 'Tools to maintenance station'),
+    TaskTemplate((1, 13), (12, 8), TaskUrgency.NORMAL, 5, 'equipment',  # Right middle
+                 'Equipment to quality control'),
+    TaskTemplate((1, 13), (7, 3), TaskUrgency.URGENT, 1, 'documents',  # Top center
+                 'Important records to administration'),
+    TaskTemplate((1, 13), (7, 11), TaskUrgency.NORMAL, 4, 'food',  # Bottom center
+                 'Meal delivery to workers area'),
+)
+
 class SystemStatistics:
     """System-wide performance statistics"""
     
@@ -32,7 +55,7 @@ class SystemStatistics:
         self.total_battery_consumed = 0.0
         self.average_task_time = 0.0
         self.system_uptime = 0.0
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         
         # Performance metrics
         self.tasks_by_urgency = {
@@ -42,10 +65,32 @@ class SystemStatistics:
         }
         
         self.robot_utilization = {}
+        
+        # Sources for the aggregate statistics, recomputed only when read
+        self._robots: List[Robot] = []
+        self._tasks: List[Task] = []
+    
+    def update(self, robots: List[Robot], tasks: List[Task], now_ns: Optional[int] = None):
+        """
+        Per-frame update: track uptime and remember the robots and tasks
+        
+        The task and robot aggregates are only needed for reports, so they are
+        computed by refresh() when read instead of every frame.
+        
+        Args:
+            robots: All robots
+            tasks: All tasks
+            now_ns: Current time.monotonic_ns(), if the caller already read it
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        self.system_uptime = (now_ns - self.start_time_ns) * 1e-9
+        self._robots = robots
+        self._tasks = tasks
     
-    def update(self, robots: List[Robot], tasks: List[Task]):
-        """Update all statistics"""
-        self.system_uptime = time.time() - self.start_time
+    def refresh(self):
+        """Recompute all task and robot statistics"""
+        robots, tasks = self._robots, self._tasks
         
         # Task statistics
         completed_tasks = [t for t in tasks if t.status == TaskStatus.COMPLETED.value]
@@ -76,10 +121,13 @@ class SystemStatistics:
         """Calculate system efficiency (0-100)"""
         if total_tasks == 0:
             return 0.0
+        self.refresh()
         return (self.total_tasks_completed / total_tasks) * 100
     
     def print_summary(self):
         """Print statistical summary"""
+        self.refresh()
+        
         print("\n" + "=" * 80)
         print("📊 SYSTEM PERFORMANCE SUMMARY")
         print("=" * 80)
@@ -112,27 +160,45 @@ class HospitalAISystem:
         
         # Core components
         self.visualization = HospitalVisualization()
-        self.robots: List[Robot] = []
         self.tasks: List[Task] = []
-        self.statistics = SystemStatistics()
+        # Number of self.tasks in each status, kept current by _on_task_status_change
+        self.task_status_counts: Counter = Counter()
         
         # Subsystems
         self.fuzzy_system = FuzzyChargingSystem()
+        self.fuzzy_system.warm_up()
+        self.robot_ranking = RobotRankingAlgorithm()
         self.pathfinding = PathfindingAlgorithms()
-        self.collision_avoidance = CollisionAvoidance()
-        
-        # Control variables
-        self.current_task_index = 0
-        self.active_assignments = {}  # {task_id: (task, robot, path)}
-        self.simulation_speed = 1.0
-        self.paused = False
+        self.pathfinding.warm_up()
+        self._log_buffer: List[str] = []  # Console lines written once per frame
         
         # Initialize system
+        self._reset_run_state()
         self.initialize_robots()
         self.create_sample_tasks()
         
         print("✅ System initialized successfully!\n")
     
+    def _reset_run_state(self):
+        """Create the per-run state that a reset discards"""
+        self.robots: List[Robot] = []
+        self.statistics = SystemStatistics()
+        self.robot_index = RobotSpatialIndex(lambda: Robot.status_version)
+        self.collision_avoidance = CollisionAvoidance()
+        
+        # Control variables
+        self.current_task_index = 0
+        self.active_assignments = {}  # {task_id: (task, robot, (N, 2) int32 path)}
+        self._primary_assignment = None  # First active assignment, shown on the dashboard
+        self._drawn_status_version = -1  # Robot.status_version at the last full redraw
+        self._completion_queue: List[str] = []  # Task ids completed since the last check
+        # Max-heap of (-priority score, sequence, task); entries whose task is no
+        # longer pending are dropped lazily when they reach the top
+        self._pending_heap: List[Tuple[int, int, Task]] = []
+        self._task_seq = itertools.count()
+        self.simulation_speed = 1.0
+        self.paused = False
+    
     def initialize_robots(self):
         """Initialize robots from map configuration"""
         positions = get_map_positions()
@@ -179,7 +245,9 @@ class HospitalAISystem:
                 robot.charge_percentage = 80
                 robot.weight_threshold = 6
             
+            robot.on_complete = self._completion_queue.append
             self.robots.append(robot)
+            self.collision_avoidance.register_robot(robot.uid, robot.id)
             print(f"   ✓ {robot.name} ({robot.id}): Speed={robot.velocity}, "
                   f"Charge={robot.charge_percentage:.0f}%, Weight={robot.weight_threshold}kg")
         
@@ -187,127 +255,144 @@ class HospitalAISystem:
     
     def create_sample_tasks(self):
         """Create sample tasks for demonstration"""
-        sample_tasks = [
-            {
-                'source': (1, 13), 
-                'destination': (12, 13),  # Changed to valid position
-                'urgency': TaskUrgency.EMERGENCY, 
-                'weight': 3, 
-                'type': 'parts',
-                'description': 'Emergency parts delivery to assembly line'
-            },
-            {
-                'source': (1, 13), 
-                'destination': (7, 7),  # Center position
-                'urgency': TaskUrgency.NORMAL, 
-                'weight': 8, 
-                'type': 'materials',
-                'description': 'Raw materials to production area'
-            },
-            {
-                'source': (1, 13), 
-                'destination': (12, 3),  # Top right area
-                'urgency': TaskUrgency.URGENT, 
-                'weight': 2, 
-                'type': 'tools', 
-                'description': 'Tools to maintenance station'
-            },
-            {
-                'source': (1, 13), 
-                'destination': (12, 8),  # Right middle
-                'urgency': TaskUrgency.NORMAL, 
-                'weight': 5, 
-                'type': 'equipment',
-                'description': 'Equipment to quality control'
-            },
-            {
-                'source': (1, 13), 
-                'destination': (7, 3),  # Top center
-                'urgency': TaskUrgency.URGENT, 
-                'weight': 1, 
-                'type': 'documents',
-                'description': 'Important records to administration'
-            },
-            {
-                'source': (1, 13), 
-                'destination': (7, 11),  # Bottom center
-                'urgency': TaskUrgency.NORMAL, 
-                'weight': 4, 
-                'type': 'food',
-                'description': 'Meal delivery to workers area'
-            }
-        ]
-        
         print("📋 Creating Sample Tasks:")
         
-        for i, task_data in enumerate(sample_tasks):
-            task = Task(
-                task_id=f"T{i+1:03d}",
-                source=task_data['source'],
-                destination=task_data['destination'],
-                urgency=task_data['urgency'],
-                item_weight=task_data['weight'],
-                item_type=task_data['type']
-            )
-            self.tasks.append(task)
+        self.tasks = [Task.from_template(template, i)
+                      for i, template in enumerate(SAMPLE_TASK_TEMPLATES)]
+        self.task_status_counts = Counter(task.status for task in self.tasks)
+        for task in self.tasks:
+            task.on_status_change = self._on_task_status_change
+            self._queue_task(task)
             print(f"   ✓ Task {task.id}: {task.get_task_name()} ({task.urgency.value})")
-            print(f"      From {task_data['source']} → To {task_data['destination']}")
+            print(f"      From {(task.source_x, task.source_y)} → To {(task.dest_x, task.dest_y)}")
         
         print(f"✅ {len(self.tasks)} tasks created\n")
     
+    def _on_task_status_change(self, old_status: str, new_status: str):
+        """Move a task between entries of task_status_counts"""
+        counts = self.task_status_counts
+        counts[old_status] -= 1
+        counts[new_status] += 1
+    
+    def reset_all(self):
+        """
+        Restart the simulation without rebuilding the window, the path caches
+        or the task objects
+        """
+        self.flush_log()
+        self.visualization.needs_redraw = True
+        self._reset_run_state()
+        self.initialize_robots()
+        
+        for task in self.tasks:
+            task.reset()
+            self._queue_task(task)
+        print(f"✅ {len(self.tasks)} tasks reset\n")
+    
+    def log(self, message: str = ""):
+        """
+        Queue a console line for the end of the current frame
+        
+        Args:
+            message: Line to print
+        """
+        if EVENT_LOG:
+            self._drain_events()
+        self._log_buffer.append(message)
+    
+    def _drain_events(self):
+        """Move robot and task events into the console buffer, oldest first"""
+        while EVENT_LOG:
+            self._log_buffer.append(EVENT_LOG.popleft()[1])
+    
+    def flush_log(self):
+        """Write all queued console lines with a single stdout write"""
+        self._drain_events()
+        if self._log_buffer:
+            sys.stdout.write("\n".join(self._log_buffer) + "\n")
+            sys.stdout.flush()
+            self._log_buffer.clear()
+    
+    def _queue_task(self, task: Task):
+        """
+        Queue a pending task for assignment
+        
+        Tasks that return to pending, or whose priority changes, must be queued
+        again; the older entry is skipped once the task leaves pending.
+        
+        Args:
+            task: Pending task
+        """
+        heapq.heappush(self._pending_heap,
+                       (-task.get_priority_score(), next(self._task_seq), task))
+    
+    def _add_assignment(self, task: Task, robot: Robot, path: np.ndarray):
+        """Record an active assignment and refresh the primary one"""
+        self.active_assignments[task.id] = (task, robot, path)
+        self._primary_assignment = next(iter(self.active_assignments.values()))
+    
+    def _remove_assignment(self, task_id: str) -> Optional[Tuple]:
+        """Drop an active assignment, returning it (or None) and refreshing the primary one"""
+        assignment = self.active_assignments.pop(task_id, None)
+        if assignment is not None:
+            self._primary_assignment = next(iter(self.active_assignments.values()), None)
+        return assignment
+    
     def assign_next_task(self) -> Optional[Tuple]:
         """Assign the next pending task to an optimal robot"""
-        # Find pending tasks
-        pending_tasks = [t for t in self.tasks if t.status == TaskStatus.PENDING.value]
+        self.visualization.needs_redraw = True
+        # Find the highest-priority pending task, discarding stale heap entries
+        pending_heap = self._pending_heap
+        while pending_heap and pending_heap[0][2].status != TaskStatus.PENDING.value:
+            heapq.heappop(pending_heap)
         
-        if not pending_tasks:
+        if not pending_heap:
             if self.current_task_index >= len(self.tasks):
-                print("🎉 All tasks have been assigned!")
+                self.log("🎉 All tasks have been assigned!")
             return None
         
-        # Get next pending task (prioritize by urgency)
-        task = max(pending_tasks, key=lambda t: t.get_priority_score())
+        # Get next pending task (prioritize by urgency); it stays queued until assigned
+        task = pending_heap[0][2]
         
-        print(f"\n{'=' * 80}")
-        print(f"🎯 Assigning Task {task.id}: {task.get_task_name()}")
-        print(f"   📍 From: ({task.source_x}, {task.source_y})")
-        print(f"   🎯 To: ({task.dest_x}, {task.dest_y})")
-        print(f"   ⚡ Urgency: {task.urgency.value}")
-        print(f"   📦 Weight: {task.item_weight} kg")
-        print(f"   🎖️  Priority Score: {task.get_priority_score()}")
-        print(f"{'=' * 80}")
+        self.log(f"\n{'=' * 80}")
+        self.log(f"🎯 Assigning Task {task.id}: {task.get_task_name()}")
+        self.log(f"   📍 From: ({task.source_x}, {task.source_y})")
+        self.log(f"   🎯 To: ({task.dest_x}, {task.dest_y})")
+        self.log(f"   ⚡ Urgency: {task.urgency.value}")
+        self.log(f"   📦 Weight: {task.item_weight} kg")
+        self.log(f"   🎖️  Priority Score: {task.get_priority_score()}")
+        self.log(f"{'=' * 80}")
         
         # Find optimal robot using RRA
-        best_robot, best_score = find_optimal_robot(self.robots, task)
+        best_robot, best_score = self.robot_ranking.find_optimal_robot(self.robots, task,
+                                                                      self.robot_index)
         
         if not best_robot:
-            print("   ⚠️  No available robots - will retry later")
+            self.log("   ⚠️  No available robots - will retry later")
             return None
         
-        # Calculate path
-        obstacles = self.visualization.obstacles
+        # Calculate path. Walls and obstacles (visualization.grid) are already
+        # in the pathfinder's static occupancy grid, so no obstacle list is passed
         
         # Path from robot to source
         path_to_source = self.pathfinding.a_star(
             (best_robot.x, best_robot.y), 
-            (task.source_x, task.source_y), 
-            obstacles
+            (task.source_x, task.source_y)
         )
         
         # Path from source to destination
         path_to_dest = self.pathfinding.a_star(
             (task.source_x, task.source_y), 
-            (task.dest_x, task.dest_y), 
-            obstacles
+            (task.dest_x, task.dest_y)
         )
         
         if not path_to_source:
-            print(f"   ❌ No path from robot to source - marking as failed")
+            self.log(f"   ❌ No path from robot to source - marking as failed")
             task.cancel("No path from robot to source")
             return None
         
         if not path_to_dest:
-            print(f"   ❌ No path from source to destination - marking as failed")
+            self.log(f"   ❌ No path from source to destination - marking as failed")
             task.cancel("No path from source to destination")
             return None
         
@@ -315,36 +400,46 @@ class HospitalAISystem:
         full_path = path_to_source + path_to_dest[1:]  # Avoid duplicate source point
         
         if len(full_path) < 2:
-            print(f"   ❌ Path too short - marking as failed")
+            self.log(f"   ❌ Path too short - marking as failed")
             task.cancel("Invalid path")
             return None
         
         # Optimize path
         try:
             optimized_path = PathOptimizer.smooth_path(full_path)
-            path_metrics = PathOptimizer.calculate_path_metrics(optimized_path)
+            # Metrics, reservations and drawing work on the (N, 2) array form
+            path_arr = np.array(optimized_path, dtype=np.int32)
+            path_metrics = PathOptimizer.calculate_path_metrics(path_arr)
         except Exception as e:
-            print(f"   ⚠️  Path optimization failed: {e}, using original path")
+            self.log(f"   ⚠️  Path optimization failed: {e}, using original path")
             optimized_path = full_path
+            path_arr = np.array(optimized_path, dtype=np.int32)
             path_metrics = {'turns': 0, 'straight_segments': 0}
         
+        # Check the path against other robots' reservations before committing
+        for step, (x, y) in enumerate(optimized_path):
+            holder = self.collision_avoidance.conflict_at(step, x, y, best_robot.uid)
+            if holder is not None:
+                self.log(f"   ⚠️  Path crosses {holder}'s reservation at step {step}")
+                break
+        
         # Assign task to robot
         best_robot.assign_task(task, optimized_path)
         
         # Register with collision avoidance
         try:
-            self.collision_avoidance.reserve_path(best_robot.id, optimized_path)
+            self.collision_avoidance.reserve_path(best_robot.uid, path_arr)
         except Exception as e:
-            print(f"   ⚠️  Collision avoidance registration failed: {e}")
+            self.log(f"   ⚠️  Collision avoidance registration failed: {e}")
         
         # Store active assignment
-        self.active_assignments[task.id] = (task, best_robot, optimized_path)
+        self._add_assignment(task, best_robot, path_arr)
         
-        print(f"   🛣️  Path calculated: {len(optimized_path)} steps")
-        print(f"   📊 Path metrics: {path_metrics.get('turns', 0)} turns, "
-              f"{path_metrics.get('straight_segments', 0)} segments")
-        print(f"   ⏱️  Estimated time: {len(optimized_path) / best_robot.velocity:.1f}s")
-        print(f"   🔋 Battery cost: ~{len(optimized_path) * best_robot.battery_drain_rate:.1f}%")
+        self.log(f"   🛣️  Path calculated: {len(optimized_path)} steps")
+        self.log(f"   📊 Path metrics: {path_metrics.get('turns', 0)} turns, "
+                 f"{path_metrics.get('straight_segments', 0)} segments")
+        self.log(f"   ⏱️  Estimated time: {len(optimized_path) / best_robot.velocity:.1f}s")
+        self.log(f"   🔋 Battery cost: ~{len(optimized_path) * best_robot.battery_drain_rate:.1f}%")
         
         self.current_task_index += 1
         
@@ -352,29 +447,28 @@ class HospitalAISystem:
     
     def update_charging_system(self):
         """Update robot charging status using fuzzy logic"""
+        self.visualization.needs_redraw = True
         available_robots = [r for r in self.robots 
                           if r.status == RobotStatus.AVAILABLE]
         
-        print("\n🔋 Battery Status Check:")
-        print("-" * 80)
+        self.log("\n🔋 Battery Status Check:")
+        self.log("-" * 80)
         
-        for robot in self.robots:
-            # Get charging priority from fuzzy system
-            priority, score, details = self.fuzzy_system.get_charging_priority(
-                robot, 
-                len(available_robots)
-            )
-            
+        # Get charging priorities from fuzzy system, all robots in one batch
+        priorities = self.fuzzy_system.get_charging_priorities(self.robots,
+                                                               len(available_robots))
+        
+        for robot, (priority, score) in zip(self.robots, priorities):
             battery_status = robot.get_battery_status()
             
-            print(f"   {battery_status['icon']} {robot.name}: "
-                  f"{robot.charge_percentage:.1f}% - {battery_status['status']} "
-                  f"(Priority: {priority}, Score: {score:.2f})")
+            self.log(f"   {battery_status.icon} {robot.name}: "
+                     f"{robot.charge_percentage:.1f}% - {battery_status.status} "
+                     f"(Priority: {priority}, Score: {score:.2f})")
             
             # Handle charging based on priority
             if priority == "CR1":  # Critical
                 if robot.status != RobotStatus.CHARGING:
-                    print(f"      ⚠️  CRITICAL! Initiating emergency charging...")
+                    self.log(f"      ⚠️  CRITICAL! Initiating emergency charging...")
                     robot.status = RobotStatus.CHARGING
                     
                     # Cancel current task if any
@@ -383,38 +477,41 @@ class HospitalAISystem:
             
             elif priority == "CR2":  # High
                 if robot.status == RobotStatus.AVAILABLE:
-                    print(f"      🔶 Scheduling charging soon...")
+                    self.log(f"      🔶 Scheduling charging soon...")
             
             # Simulate charging for demo purposes
             if robot.status == RobotStatus.CHARGING:
                 robot.charge_battery()
                 if robot.charge_percentage >= 80:
-                    print(f"      ✅ {robot.name} fully charged!")
+                    self.log(f"      ✅ {robot.name} fully charged!")
         
-        print("-" * 80)
+        self.log("-" * 80)
     
     def check_completed_tasks(self):
         """Check for completed tasks and clean up"""
-        completed_ids = []
-        
-        for task_id, (task, robot, path) in self.active_assignments.items():
-            if task.status == TaskStatus.COMPLETED.value:
-                completed_ids.append(task_id)
-                self.collision_avoidance.release_path(robot.id)
-                
-                print(f"✅ Task {task.id} completed by {robot.name}")
-                print(f"   Duration: {task.get_duration():.1f}s")
-                print(f"   Distance: {len(path)} steps")
+        # Robots report completions through on_complete, so only tasks that
+        # finished since the last check are visited
+        for task_id in self._completion_queue:
+            assignment = self._remove_assignment(task_id)
+            if assignment is None:
+                continue
+            task, robot, path = assignment
+            self.collision_avoidance.release_path(robot.uid)
+            
+            self.log(f"✅ Task {task.id} completed by {robot.name}")
+            self.log(f"   Duration: {task.get_duration():.1f}s")
+            self.log(f"   Distance: {len(path)} steps")
         
-        # Remove completed assignments
-        for task_id in completed_ids:
-            del self.active_assignments[task_id]
+        self._completion_queue.clear()
     
     def update_system(self, delta_time: float):
         """Update all system components"""
+        # Read the clock once per frame for every robot
+        now = time.monotonic()
+        
         # Update robots
         for robot in self.robots:
-            robot.update(delta_time)
+            robot.update(delta_time, now)
         
         # Check for completed tasks
         self.check_completed_tasks()
@@ -423,16 +520,27 @@ class HospitalAISystem:
         self.statistics.update(self.robots, self.tasks)
     
     def draw_scene(self):
-        """Draw complete scene"""
+        """Draw complete scene, skipping frames in which nothing visible changed"""
+        visualization = self.visualization
+        animating = not self.paused and (
+            self.active_assignments or
+            any(robot.status == RobotStatus.CHARGING for robot in self.robots))
+        if (not animating and not visualization.needs_redraw
+                and self._drawn_status_version == Robot.status_version):
+            return
+        visualization.needs_redraw = False
+        self._drawn_status_version = Robot.status_version
+        
         # Prepare dashboard info
         current_task_info = ""
-        if self.active_assignments:
+        if self._primary_assignment is not None:
             # Show info for first active task
-            task, robot, _ = list(self.active_assignments.values())[0]
+            task, robot, _ = self._primary_assignment
             current_task_info = f"{robot.name} transporting {task.get_task_name()}"
         
         # Draw main dashboard (includes everything)
-        self.visualization.draw_dashboard(self.robots, self.tasks, current_task_info)
+        self.visualization.draw_dashboard(self.robots, self.tasks, current_task_info,
+                                          self.task_status_counts)
         
         # Draw all active paths and animations on the map
         for task_id, (task, robot, path) in self.active_assignments.items():
@@ -513,8 +621,16 @@ class HospitalAISystem:
         AUTO_ASSIGN_INTERVAL = 3000  # 3 seconds
         CHARGING_CHECK_INTERVAL = 10000  # 10 seconds
         
+        # The simulation advances in fixed steps of wall-clock time, independent
+        # of how long frames take to draw; the scene is only redrawn after a step
+        # or when something else asked for it
+        SIMULATION_STEP_MS = 1000 / 30  # Robots move one cell per step
+        MAX_SIMULATION_STEPS = 5  # Per frame; beyond this the backlog is dropped
+        simulation_timer = 0.0
+        
         while self.visualization.running:
-            delta_time = self.visualization.clock.get_time() / 1000.0  # Convert to seconds
+            frame_time = self.visualization.clock.get_time()  # Milliseconds
+            steps = 0
             
             # Handle events
             event_result = self.visualization.handle_events()
@@ -526,35 +642,46 @@ class HospitalAISystem:
             elif event_result == "pause":
                 self.paused = not self.paused
                 status = "PAUSED" if self.paused else "RESUMED"
+                self.visualization.needs_redraw = True
                 print(f"\n⏸️  System {status}")
             elif event_result == "reset":
+                self.flush_log()
                 print("\n🔄 Resetting system...")
-                self.__init__()
+                self.reset_all()
             
             if not self.paused:
                 # Auto-assign tasks
-                auto_assign_timer += self.visualization.clock.get_time()
+                auto_assign_timer += frame_time
                 if auto_assign_timer > AUTO_ASSIGN_INTERVAL:
                     if not self.active_assignments and self.current_task_index < len(self.tasks):
                         self.assign_next_task()
                     auto_assign_timer = 0
                 
                 # Periodic charging check
-                charging_check_timer += self.visualization.clock.get_time()
+                charging_check_timer += frame_time
                 if charging_check_timer > CHARGING_CHECK_INTERVAL:
                     self.update_charging_system()
                     charging_check_timer = 0
                 
                 # Update system
-                self.update_system(delta_time)
+                simulation_timer += frame_time
+                while simulation_timer >= SIMULATION_STEP_MS and steps < MAX_SIMULATION_STEPS:
+                    self.update_system(SIMULATION_STEP_MS / 1000.0)
+                    simulation_timer -= SIMULATION_STEP_MS
+                    steps += 1
+                if steps == MAX_SIMULATION_STEPS:
+                    simulation_timer = 0.0
             
             # Draw scene
-            self.draw_scene()
+            if steps or self.visualization.needs_redraw:
+                self.draw_scene()
+            self.flush_log()
             
             # Control frame rate
             self.visualization.clock.tick(60)  # 60 FPS
         
         # Print final report and cleanup
+        self.flush_log()
         self.print_final_report()
         pygame.quit()
         sys.exit()
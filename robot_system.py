@@ -6,9 +6,11 @@ Defines robot and task classes with comprehensive functionality
 import pygame
 import numpy as np
 from enum import Enum
-from typing import List, Tuple, Optional, Dict
+from typing import List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass
 import time
+import itertools
+from collections import deque
 
 
 class RobotStatus(Enum):
@@ -36,6 +38,48 @@ class TaskStatus(Enum):
     CANCELLED = "Cancelled"
 
 
+class TaskTemplate(NamedTuple):
+    """Immutable description of a task that can be instantiated repeatedly"""
+    source: Tuple[int, int]
+    destination: Tuple[int, int]
+    urgency: TaskUrgency
+    weight: float
+    item_type: str
+    description: str = ""
+
+
+class BatteryStatus(NamedTuple):
+    """Battery reading with its display category"""
+    percentage: float
+    status: str
+    icon: str
+    color: Tuple[int, int, int]
+    needs_charging: bool
+
+
+# Battery categories from best to worst: (lower bound %, status, icon, colour)
+_BATTERY_LEVELS = (
+    (60, "Good", "🟢", (80, 220, 100)),
+    (30, "Medium", "🟡", (255, 200, 50)),
+    (15, "Low", "🟠", (255, 150, 50)),
+    (0, "Critical", "🔴", (255, 80, 80)),
+)
+
+# Robot and task events, oldest first, as (monotonic time, message)
+EVENT_LOG_SIZE = 200
+EVENT_LOG: deque = deque(maxlen=EVENT_LOG_SIZE)
+
+
+def log_event(message: str):
+    """
+    Record a robot or task event without writing to stdout
+    
+    Args:
+        message: Event text
+    """
+    EVENT_LOG.append((time.monotonic(), message))
+
+
 @dataclass
 class PerformanceMetrics:
     """Performance tracking metrics"""
@@ -53,16 +97,68 @@ class Robot:
     Autonomous robot with navigation, task execution, and battery management
     """
     
+    # Fixed attribute layout: no per-instance __dict__, descriptor-based access
+    __slots__ = (
+        'id', 'uid', 'name', 'x', 'y', 'initial_position',
+        '_status', '_velocity', 'max_velocity', 'charge_percentage', 'max_charge',
+        'weight_threshold', 'current_task', 'path', 'task_queue',
+        'target_x', 'target_y', 'move_progress', 'movement_speed',
+        'battery_drain_rate', 'charging_rate', 'low_battery_threshold',
+        'critical_battery_threshold', '_drain_per_step',
+        'completed_tasks', 'on_complete', 'metrics',
+        'color', 'animation_frame', 'task_start_time', 'last_update_time',
+    )
+    
+    # Source of Robot.uid, unique per process
+    _uid_counter = itertools.count()
+    
+    # Status icons used by get_status_info
+    STATUS_ICONS = {
+        RobotStatus.AVAILABLE: "🟢",
+        RobotStatus.BUSY: "🔴",
+        RobotStatus.CHARGING: "🔋",
+        RobotStatus.MAINTENANCE: "🔧",
+        RobotStatus.IDLE: "🟡"
+    }
+    
+    # Bumped on every status change of any robot, so fleet-wide caches (the
+    # ranking spatial index) can tell when the set of available robots changed
+    status_version = 0
+    
+    @property
+    def status(self) -> RobotStatus:
+        return self._status
+    
+    @status.setter
+    def status(self, value: RobotStatus):
+        self._status = value
+        Robot.status_version += 1
+    
+    @property
+    def velocity(self) -> float:
+        return self._velocity
+    
+    @velocity.setter
+    def velocity(self, value: float):
+        self._velocity = value
+        self._recompute_drain()
+    
+    @property
+    def total_distance(self) -> float:
+        """Grid steps travelled, as recorded in the performance metrics"""
+        return self.metrics.total_distance
+    
     def __init__(self, robot_id: str, x: int, y: int, name: str, color: Tuple[int, int, int] = None):
         # Basic properties
         self.id = robot_id
+        self.uid = next(Robot._uid_counter)  # Integer key for hot-path lookups
         self.name = name
         self.x, self.y = x, y
         self.initial_position = (x, y)
         
         # Status and capabilities
         self.status = RobotStatus.AVAILABLE
-        self.velocity = np.random.randint(15, 30)
+        self._velocity = np.random.randint(15, 30)
         self.max_velocity = 30
         self.charge_percentage = np.random.uniform(70, 100)
         self.max_charge = 100.0
@@ -70,7 +166,7 @@ class Robot:
         
         # Task management
         self.current_task = None
-        self.path = []
+        self.path = deque()  # Remaining waypoints, consumed from the left
         self.task_queue = []
         
         # Movement and animation
@@ -83,10 +179,11 @@ class Robot:
         self.charging_rate = 2.0  # Per update when charging
         self.low_battery_threshold = 20.0
         self.critical_battery_threshold = 10.0
+        self._recompute_drain()
         
         # Performance tracking
         self.completed_tasks = 0
-        self.total_distance = 0.0
+        self.on_complete = None  # Optional callback(task_id) when a task completes
         self.metrics = PerformanceMetrics()
         
         # Visual properties
@@ -95,7 +192,7 @@ class Robot:
         
         # Timing
         self.task_start_time = None
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
     
     def _get_default_color(self) -> Tuple[int, int, int]:
         """Get default color based on robot ID"""
@@ -107,12 +204,13 @@ class Robot:
         }
         return color_map.get(self.id, (128, 128, 128))
     
-    def update(self, delta_time: float = 0.016):
+    def update(self, delta_time: float = 0.016, now: Optional[float] = None):
         """
         Update robot state each frame
         
         Args:
             delta_time: Time elapsed since last update
+            now: Current time.monotonic(), read once per frame by the caller
         """
         self.animation_frame = (self.animation_frame + 1) % 60
         
@@ -123,8 +221,8 @@ class Robot:
             self.charge_battery()
         
         # Update metrics
-        current_time = time.time()
-        if self.task_start_time:
+        if self.task_start_time is not None:
+            current_time = time.monotonic() if now is None else now
             self.metrics.total_time = current_time - self.task_start_time
     
     def move_along_path(self):
@@ -135,7 +233,7 @@ class Robot:
         next_x, next_y = self.path[0]
         
         # Smooth movement
-        if (self.x, self.y) != (next_x, next_y):
+        if self.x != next_x or self.y != next_y:
             dx = next_x - self.x
             dy = next_y - self.y
             
@@ -145,28 +243,35 @@ class Robot:
             else:
                 self.y += 1 if dy > 0 else -1
             
-            self.total_distance += 1
             self.metrics.total_distance += 1
         else:
             # Reached waypoint, move to next
-            self.path.pop(0)
+            self.path.popleft()
             
             # Check if reached final destination
             if not self.path and self.current_task:
                 self.complete_task()
     
+    def _recompute_drain(self):
+        """
+        Cache the battery drain per movement step
+        
+        Called when velocity is set; call it directly after changing
+        max_velocity or battery_drain_rate.
+        """
+        # Battery drain varies with velocity
+        self._drain_per_step = self.battery_drain_rate * (self._velocity / self.max_velocity)
+    
     def consume_battery(self):
         """Consume battery during movement"""
-        # Battery drain varies with velocity
-        velocity_factor = self.velocity / self.max_velocity
-        drain = self.battery_drain_rate * velocity_factor
+        drain = self._drain_per_step
         
         self.charge_percentage = max(0, self.charge_percentage - drain)
         self.metrics.battery_consumed += drain
         
         # Check for critical battery
         if self.charge_percentage <= self.critical_battery_threshold:
-            print(f"⚠️  {self.name}: Critical battery level! ({self.charge_percentage:.1f}%)")
+            log_event(f"⚠️  {self.name}: Critical battery level! ({self.charge_percentage:.1f}%)")
             if self.status == RobotStatus.BUSY:
                 self.status = RobotStatus.CHARGING
     
@@ -179,7 +284,7 @@ class Robot:
         # Resume operation when sufficiently charged
         if self.charge_percentage >= 80.0:
             self.status = RobotStatus.AVAILABLE
-            print(f"✅ {self.name}: Battery charged to {self.charge_percentage:.1f}%")
+            log_event(f"✅ {self.name}: Battery charged to {self.charge_percentage:.1f}%")
     
     def assign_task(self, task, path: List[Tuple[int, int]]):
         """
@@ -190,15 +295,15 @@ class Robot:
             path: Navigation path for the task
         """
         self.current_task = task
-        self.path = path.copy()
+        self.path = deque(path)
         self.status = RobotStatus.BUSY
-        self.task_start_time = time.time()
+        self.task_start_time = time.monotonic()
         
         task.status = TaskStatus.IN_PROGRESS.value
         task.assigned_robot = self
-        task.assignment_time = time.time()
+        task.assignment_time = time.monotonic()
         
-        print(f"📋 {self.name} assigned to Task {task.id}: {task.get_task_name()}")
+        log_event(f"📋 {self.name} assigned to Task {task.id}: {task.get_task_name()}")
     
     def complete_task(self):
         """Complete the current task"""
@@ -214,7 +319,10 @@ class Robot:
         if self.metrics.total_time > 0:
             self.metrics.average_speed = self.metrics.total_distance / self.metrics.total_time
         
-        print(f"✅ {self.name} completed Task {self.current_task.id}")
+        log_event(f"✅ {self.name} completed Task {self.current_task.id}")
+        
+        if self.on_complete is not None:
+            self.on_complete(self.current_task.id)
         
         self.current_task = None
         self.status = RobotStatus.AVAILABLE
@@ -225,55 +333,28 @@ class Robot:
         if self.current_task:
             self.current_task.cancel(reason)
             self.metrics.failed_deliveries += 1
-            print(f"❌ {self.name} cancelled Task {self.current_task.id}: {reason}")
+            log_event(f"❌ {self.name} cancelled Task {self.current_task.id}: {reason}")
             
             self.current_task = None
-            self.path = []
+            self.path = deque()
             self.status = RobotStatus.AVAILABLE
     
     def return_to_base(self, base_position: Tuple[int, int]):
         """Return robot to base/charging station"""
-        self.path = [base_position]
+        self.path = deque([base_position])
         self.status = RobotStatus.BUSY
     
-    def get_battery_status(self) -> Dict:
+    def get_battery_status(self) -> 'BatteryStatus':
         """Get detailed battery status"""
-        if self.charge_percentage >= 60:
-            status = "Good"
-            icon = "🟢"
-            color = (80, 220, 100)
-        elif self.charge_percentage >= 30:
-            status = "Medium"
-            icon = "🟡"
-            color = (255, 200, 50)
-        elif self.charge_percentage >= 15:
-            status = "Low"
-            icon = "🟠"
-            color = (255, 150, 50)
-        else:
-            status = "Critical"
-            icon = "🔴"
-            color = (255, 80, 80)
-        
-        return {
-            'percentage': self.charge_percentage,
-            'status': status,
-            'icon': icon,
-            'color': color,
-            'needs_charging': self.charge_percentage < self.low_battery_threshold
-        }
+        # float() keeps the comparisons Python bools (NumPy bools add as logical or)
+        pct = float(self.charge_percentage)
+        _, status, icon, color = _BATTERY_LEVELS[(pct < 60) + (pct < 30) + (pct < 15)]
+        return BatteryStatus(self.charge_percentage, status, icon, color,
+                             pct < self.low_battery_threshold)
     
     def get_status_info(self) -> str:
         """Get formatted status information"""
-        status_icons = {
-            RobotStatus.AVAILABLE: "🟢",
-            RobotStatus.BUSY: "🔴",
-            RobotStatus.CHARGING: "🔋",
-            RobotStatus.MAINTENANCE: "🔧",
-            RobotStatus.IDLE: "🟡"
-        }
-        
-        icon = status_icons.get(self.status, "❓")
+        icon = self.STATUS_ICONS.get(self.status, "❓")
         return f"{icon} {self.name} | {self.status.value} | Battery: {self.charge_percentage:.0f}%"
     
     def draw(self, screen, font):
@@ -325,7 +406,7 @@ class Robot:
         
         # Battery fill
         fill_width = int((bar_width - 2) * self.charge_percentage / 100)
-        pygame.draw.rect(screen, battery_status['color'], 
+        pygame.draw.rect(screen, battery_status.color, 
                         (bar_x + 1, bar_y + 1, fill_width, bar_height - 2))
         
         # Draw robot name
@@ -339,9 +420,9 @@ class Robot:
         screen.blit(charge_text, charge_rect)
         
         # Draw path if exists
-        if self.path and len(self.path) > 0:
+        if self.path:
             # Draw small dots along path
-            for pos in self.path[:5]:  # Show next 5 waypoints
+            for pos in itertools.islice(self.path, 5):  # Show next 5 waypoints
                 dot_x = pos[0] * 40 + 20
                 dot_y = pos[1] * 40 + 20
                 pygame.draw.circle(screen, (150, 150, 200), (dot_x, dot_y), 3)
@@ -352,6 +433,15 @@ class Task:
     Task/Delivery assignment for robots
     """
     
+    # Fixed attribute layout: no per-instance __dict__, descriptor-based access
+    __slots__ = (
+        'id', 'source_x', 'source_y', 'dest_x', 'dest_y', 'urgency', '_urgency_mul',
+        'item_weight', 'item_type', '_priority', '_task_name', '_status', 'on_status_change',
+        'assigned_robot',
+        'creation_time', 'assignment_time', 'completion_time', 'cancellation_time',
+        'cancellation_reason', 'attempts', 'max_attempts',
+    )
+    
     # Task type definitions
     TASK_TYPES = {
         "parts": {"name": "parts Delivery", "icon": "⚙️", "priority": 3},
@@ -361,6 +451,38 @@ class Task:
         "documents": {"name": "Document Delivery", "icon": "📄", "priority": 1},
     }
     
+    # Urgency weighting used by the robot ranking algorithm
+    RANK_URGENCY_MULTIPLIERS = {
+        TaskUrgency.NORMAL: 1.0,
+        TaskUrgency.URGENT: 1.5,
+        TaskUrgency.EMERGENCY: 2.0
+    }
+    
+    # Urgency icons used by get_status_info
+    URGENCY_ICONS = {
+        TaskUrgency.NORMAL: "🟢",
+        TaskUrgency.URGENT: "🟡",
+        TaskUrgency.EMERGENCY: "🔴"
+    }
+    
+    # Urgency weighting used by the task scheduler's priority score
+    PRIORITY_URGENCY_MULTIPLIERS = {
+        TaskUrgency.NORMAL: 1,
+        TaskUrgency.URGENT: 2,
+        TaskUrgency.EMERGENCY: 3
+    }
+    
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @status.setter
+    def status(self, value: str):
+        old_status = self._status
+        self._status = value
+        if self.on_status_change is not None:
+            self.on_status_change(old_status, value)
+    
     def __init__(self, task_id: str, source: Tuple[int, int], destination: Tuple[int, int],
                  urgency: TaskUrgency, item_weight: float, item_type: str):
         # Basic properties
@@ -368,15 +490,22 @@ class Task:
         self.source_x, self.source_y = source
         self.dest_x, self.dest_y = destination
         self.urgency = urgency
+        self._urgency_mul = self.RANK_URGENCY_MULTIPLIERS.get(urgency, 1.0)
         self.item_weight = item_weight
         self.item_type = item_type
+        self._priority = _PRIORITY_TABLE.get((item_type, urgency))
+        if self._priority is None:
+            self._priority = self._compute_priority_score(item_type, urgency)
+        task_info = self.TASK_TYPES.get(item_type, {"name": "Unknown Task", "icon": "❓"})
+        self._task_name = f"{task_info['icon']} {task_info['name']}"
         
         # Status tracking
-        self.status = TaskStatus.PENDING.value
+        self._status = TaskStatus.PENDING.value
+        self.on_status_change = None  # Optional callback(old_status, new_status)
         self.assigned_robot = None
         
         # Timing
-        self.creation_time = time.time()
+        self.creation_time = time.monotonic()
         self.assignment_time = None
         self.completion_time = None
         self.cancellation_time = None
@@ -386,35 +515,64 @@ class Task:
         self.attempts = 0
         self.max_attempts = 3
     
+    @classmethod
+    def from_template(cls, template: TaskTemplate, index: int) -> 'Task':
+        """
+        Create a task from a template
+        
+        Args:
+            template: Task template
+            index: Zero-based position used for the task id
+            
+        Returns:
+            Task: New pending task
+        """
+        return cls(
+            task_id=f"T{index + 1:03d}",
+            source=template.source,
+            destination=template.destination,
+            urgency=template.urgency,
+            item_weight=template.weight,
+            item_type=template.item_type
+        )
+    
+    def reset(self):
+        """Return the task to a fresh pending state, keeping its definition"""
+        self.status = TaskStatus.PENDING.value
+        self.assigned_robot = None
+        self.creation_time = time.monotonic()
+        self.assignment_time = None
+        self.completion_time = None
+        self.cancellation_time = None
+        self.cancellation_reason = None
+        self.attempts = 0
+    
     def get_task_name(self) -> str:
         """Get human-readable task name"""
-        task_info = self.TASK_TYPES.get(self.item_type, {"name": "Unknown Task", "icon": "❓"})
-        return f"{task_info['icon']} {task_info['name']}"
+        return self._task_name
+    
+    @classmethod
+    def _compute_priority_score(cls, item_type: str, urgency: TaskUrgency) -> int:
+        """Priority score for an item type and urgency (table miss path)"""
+        base_priority = cls.TASK_TYPES.get(item_type, {}).get('priority', 1)
+        return base_priority * cls.PRIORITY_URGENCY_MULTIPLIERS.get(urgency, 1)
     
     def get_priority_score(self) -> int:
         """Get task priority score"""
-        base_priority = self.TASK_TYPES.get(self.item_type, {}).get('priority', 1)
-        
-        urgency_multiplier = {
-            TaskUrgency.NORMAL: 1,
-            TaskUrgency.URGENT: 2,
-            TaskUrgency.EMERGENCY: 3
-        }.get(self.urgency, 1)
-        
-        return base_priority * urgency_multiplier
+        return self._priority
     
     def complete(self):
         """Mark task as completed"""
         self.status = TaskStatus.COMPLETED.value
-        self.completion_time = time.time()
-        print(f"✅ Task {self.id} completed: {self.get_task_name()}")
+        self.completion_time = time.monotonic()
+        log_event(f"✅ Task {self.id} completed: {self.get_task_name()}")
     
     def cancel(self, reason: str = "Unknown"):
         """Cancel task"""
         self.status = TaskStatus.CANCELLED.value
-        self.cancellation_time = time.time()
+        self.cancellation_time = time.monotonic()
         self.cancellation_reason = reason
-        print(f"❌ Task {self.id} cancelled: {reason}")
+        log_event(f"❌ Task {self.id} cancelled: {reason}")
     
     def retry(self):
         """Retry failed task"""
@@ -442,7 +600,7 @@ class Task:
         """Get time waiting for assignment"""
         if self.assignment_time:
             return self.assignment_time - self.creation_time
-        return time.time() - self.creation_time
+        return time.monotonic() - self.creation_time
     
     def get_execution_time(self) -> float:
         """Get time from assignment to completion"""
@@ -452,16 +610,18 @@ class Task:
     
     def get_status_info(self) -> str:
         """Get formatted status information"""
-        urgency_icons = {
-            TaskUrgency.NORMAL: "🟢",
-            TaskUrgency.URGENT: "🟡",
-            TaskUrgency.EMERGENCY: "🔴"
-        }
-        
-        icon = urgency_icons.get(self.urgency, "❓")
+        icon = self.URGENCY_ICONS.get(self.urgency, "❓")
         robot_info = f" → {self.assigned_robot.name}" if self.assigned_robot else ""
         
         return f"{icon} Task {self.id}: {self.get_task_name()} | {self.status}{robot_info}"
     
     def __repr__(self) -> str:
-        return f"Task({self.id}, {self.item_type}, {self.urgency.value}, {self.status})"
\ No newline at end of file
+        return f"Task({self.id}, {self.item_type}, {self.urgency.value}, {self.status})"
+
+
+# Every known (item type, urgency) priority score, folded once at import
+_PRIORITY_TABLE = {
+    (item_type, urgency): Task._compute_priority_score(item_type, urgency)
+    for item_type in Task.TASK_TYPES
+    for urgency in TaskUrgency
+}
\ No newline at end of file
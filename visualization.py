@@ -1,6 +1,26 @@
 import pygame
+import numpy as np
 import sys
-from hospital_config import HOSPITAL_MAP, COLORS, GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
+from collections import Counter
+from hospital_config import HOSPITAL_MAP, WALKABLE, PALETTE, GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
+from robot_system import RobotStatus, TaskStatus
+
+# Robot sprites are drawn around (ROBOT_SPRITE_HALF, ROBOT_SPRITE_HALF) on a
+# surface whose background is the transparent colour key
+ROBOT_SPRITE_HALF = 24
+SPRITE_KEY = (1, 2, 3)
+
+# Upper bounds on cached text surfaces, wrapped lines and dashed-path frames
+# before each cache is reset
+TEXT_CACHE_SIZE = 1024
+WRAP_CACHE_SIZE = 128
+PATH_CACHE_SIZE = 64
+
+# Labels of the system overview's 2x2 stat grid, row by row
+OVERVIEW_STAT_LABELS = ("🤖 Robots", "✅ Completed", "🔄 Active", "⏳ Pending")
+
+# The animated dash pattern repeats every PATH_DASH_PHASES frames
+PATH_DASH_PHASES = 4
 
 class HospitalVisualization:
     def __init__(self):
@@ -20,12 +40,21 @@ class HospitalVisualization:
         self.map_x = 0
         self.map_y = self.top_bar_height
         
+        # Screen pixel centre of each map column and row
+        self._cell_cx = [self.map_x + x * GRID_SIZE + GRID_SIZE // 2 for x in range(len(HOSPITAL_MAP[0]))]
+        self._cell_cy = [self.map_y + y * GRID_SIZE + GRID_SIZE // 2 for y in range(len(HOSPITAL_MAP))]
+        
         # Right panel positioning
         self.panel_x = self.map_width
         self.panel_y = self.top_bar_height
         
         self.screen = pygame.display.set_mode((self.total_width, self.total_height))
         pygame.display.set_caption("AI Factory Robot Management System")
+        
+        # Only the events handle_events acts on are queued; SDL drops the rest
+        # (mouse motion in particular) before they become Python objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL, pygame.VIDEOEXPOSE])
         self.clock = pygame.time.Clock()
         
         # Improved font system
@@ -37,6 +66,7 @@ class HospitalVisualization:
         self.font_title = pygame.font.SysFont('Segoe UI', 22, bold=True)
         
         self.running = True
+        self.grid = (~WALKABLE).astype(np.int8)  # (H, W) occupancy: 1 = wall or obstacle
         self.obstacles = self.extract_obstacles()
         
         # Animation
@@ -56,174 +86,344 @@ class HospitalVisualization:
         self.danger = (234, 67, 53)
         self.info = (101, 103, 237)
         
+        # Status colours keyed by enum member, so lookups skip Enum.value
+        self.status_colors = {
+            RobotStatus.AVAILABLE: self.success,
+            RobotStatus.BUSY: self.danger,
+            RobotStatus.CHARGING: self.warning
+        }
+        
         # Scroll system for right panel
         self.scroll_offset = 0
         self.max_scroll = 0
         
+        # Set whenever the next frame must be redrawn even if the scene is static
+        self.needs_redraw = True
+        
+        # Only the panel and the dynamic map items change between frames, so
+        # update() pushes their rects from this frame and the previous one
+        # (to erase items that moved) instead of the whole window. A full
+        # flip is needed for the first frame and after the window is exposed.
+        self.panel_rect = pygame.Rect(self.panel_x, self.panel_y, self.right_panel_width, self.map_height)
+        
+        # Scratch rect for per-frame panel shapes that are drawn and discarded
+        self._scratch_rect = pygame.Rect(0, 0, 0, 0)
+        self._dirty_rects = []
+        self._last_dirty_rects = []
+        self._full_update = True
+        
+        # Pre-rendered robot sprites keyed by appearance
+        self._robot_sprites = {}
+        
+        # Rendered text surfaces keyed by (font, text, colour)
+        self._text_cache = {}
+        
+        # Wrapped lines keyed by (font, text, maximum width)
+        self._wrap_cache = {}
+        
+        # Pre-rendered phases of animated paths keyed by (pixel centres, colour, width)
+        self._path_frames = {}
+        
+        # The top bar and hospital map never change, so they are drawn once and blitted
+        self.top_bar_surface = self._build_top_bar_surface()
+        self.map_surface = self._build_map_surface()
+        self.static_panel_surface = self._build_static_panel_surface()
+        self.overview_surface = self._build_overview_surface()
+        
+    def render_text(self, font, text, color):
+        """
+        Render antialiased text, reusing the surface for repeated strings
+        
+        Most dashboard labels are identical from frame to frame, so only text
+        that actually changed (a new battery percentage, a new count) is
+        rasterized. The cache is cleared when it grows past TEXT_CACHE_SIZE.
+        
+        Args:
+            font: pygame Font
+            text: String to render
+            color: Text colour
+        
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha(self.screen)
+            self._text_cache[key] = surface
+        return surface
+    
     def extract_obstacles(self):
-        """Extract obstacles from the hospital map"""
-        obstacles = []
-        for y, row in enumerate(HOSPITAL_MAP):
-            for x, cell in enumerate(row):
-                if cell == '#' or cell == 'O':
-                    obstacles.append((x, y))
-        return obstacles
+        """Extract obstacle positions, row by row, from the occupancy grid"""
+        return tuple((x, y) for y, x in np.argwhere(self.grid).tolist())
     
-    def draw_top_bar(self):
-        """Draw compact top bar"""
+    def _build_top_bar_surface(self):
+        """
+        Render the static top bar off-screen
+        
+        Returns:
+            pygame.Surface: Gradient bar with title and status indicator
+        """
+        surface = pygame.Surface((self.total_width, self.top_bar_height)).convert(self.screen)
+        
         # Gradient background
         for i in range(self.top_bar_height):
             ratio = i / self.top_bar_height
             r = int(66 + (20 * ratio))
             g = int(133 + (20 * ratio))
             b = int(244 + (11 * ratio))
-            pygame.draw.line(self.screen, (r, g, b), (0, i), (self.total_width, i))
+            pygame.draw.line(surface, (r, g, b), (0, i), (self.total_width, i))
         
         # Title with icon
-        title = self.font_title.render("🏥 AI Hospital Robot Management", True, (255, 255, 255))
-        self.screen.blit(title, (15, (self.top_bar_height - title.get_height()) // 2))
+        title = self.render_text(self.font_title, "🏥 AI Hospital Robot Management", (255, 255, 255))
+        surface.blit(title, (15, (self.top_bar_height - title.get_height()) // 2))
         
         # Status indicator
-        status_text = self.font_small.render("Live System", True, (200, 255, 200))
+        status_text = self.render_text(self.font_small, "Live System", (200, 255, 200))
         status_rect = status_text.get_rect(topright=(self.total_width - 15, 15))
-        self.screen.blit(status_text, status_rect)
+        surface.blit(status_text, status_rect)
+        return surface
     
-    def draw_hospital_map(self):
-        """Draw the hospital map"""
-        # Map background
-        map_rect = pygame.Rect(self.map_x, self.map_y, self.map_width, self.map_height)
-        pygame.draw.rect(self.screen, COLORS['floor'], map_rect)
+    def draw_top_bar(self):
+        """Draw compact top bar"""
+        self.screen.blit(self.top_bar_surface, (0, 0))
+    
+    def _build_map_surface(self):
+        """
+        Render the static hospital map off-screen
+        
+        Returns:
+            pygame.Surface: Map with cells, grid lines and border
+        """
+        surface = pygame.Surface((self.map_width, self.map_height)).convert(self.screen)
+        map_rect = surface.get_rect()
+        surface.fill(PALETTE.floor)
+        
+        source_label = self.render_text(self.font_tiny, "S", (255, 255, 255))
+        destination_label = self.render_text(self.font_tiny, "D", (255, 255, 255))
         
         # Draw cells
         for y, row in enumerate(HOSPITAL_MAP):
             for x, cell in enumerate(row):
-                cell_x = self.map_x + (x * GRID_SIZE)
-                cell_y = self.map_y + (y * GRID_SIZE)
-                rect = pygame.Rect(cell_x, cell_y, GRID_SIZE, GRID_SIZE)
+                rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
                 
                 if cell == '#':  # Wall
-                    pygame.draw.rect(self.screen, COLORS['wall'], rect)
-                    pygame.draw.rect(self.screen, (60, 60, 70), rect, 1)
+                    pygame.draw.rect(surface, PALETTE.wall, rect)
+                    pygame.draw.rect(surface, (60, 60, 70), rect, 1)
                     
                 elif cell == 'O':  # Obstacle
-                    pygame.draw.rect(self.screen, COLORS['obstacle'], rect)
-                    pygame.draw.circle(self.screen, (180, 100, 80), rect.center, 8)
+                    pygame.draw.rect(surface, PALETTE.obstacle, rect)
+                    pygame.draw.circle(surface, (180, 100, 80), rect.center, 8)
                     
                 elif cell == 'S':  # Source
-                    pygame.draw.rect(self.screen, COLORS['source'], rect)
-                    pygame.draw.circle(self.screen, (40, 180, 100), rect.center, 15, 3)
-                    text = self.font_tiny.render("S", True, (255, 255, 255))
-                    text_rect = text.get_rect(center=rect.center)
-                    self.screen.blit(text, text_rect)
+                    pygame.draw.rect(surface, PALETTE.source, rect)
+                    pygame.draw.circle(surface, (40, 180, 100), rect.center, 15, 3)
+                    surface.blit(source_label, source_label.get_rect(center=rect.center))
                     
                 elif cell == 'D':  # Destination
-                    pygame.draw.rect(self.screen, COLORS['destination'], rect)
-                    pygame.draw.circle(self.screen, (80, 110, 200), rect.center, 15, 3)
-                    text = self.font_tiny.render("D", True, (255, 255, 255))
-                    text_rect = text.get_rect(center=rect.center)
-                    self.screen.blit(text, text_rect)
-                
-                # Subtle grid
-                pygame.draw.rect(self.screen, (230, 230, 235), rect, 1)
+                    pygame.draw.rect(surface, PALETTE.destination, rect)
+                    pygame.draw.circle(surface, (80, 110, 200), rect.center, 15, 3)
+                    surface.blit(destination_label, destination_label.get_rect(center=rect.center))
+        
+        # Subtle grid: each cell is outlined on its first and last pixel row and column
+        rows, cols = len(HOSPITAL_MAP), len(HOSPITAL_MAP[0])
+        grid_bottom, grid_right = rows * GRID_SIZE - 1, cols * GRID_SIZE - 1
+        for edge in (0, GRID_SIZE - 1):
+            for y in range(edge, rows * GRID_SIZE, GRID_SIZE):
+                pygame.draw.line(surface, (230, 230, 235), (0, y), (grid_right, y))
+            for x in range(edge, cols * GRID_SIZE, GRID_SIZE):
+                pygame.draw.line(surface, (230, 230, 235), (x, 0), (x, grid_bottom))
         
         # Map border
-        pygame.draw.rect(self.screen, self.border, map_rect, 3)
+        pygame.draw.rect(surface, self.border, map_rect, 3)
+        return surface
+    
+    def draw_hospital_map(self):
+        """Draw the hospital map"""
+        self.screen.blit(self.map_surface, (self.map_x, self.map_y))
     
     def draw_robot_on_map(self, robot):
         """Draw single robot on map"""
-        x = self.map_x + (robot.x * GRID_SIZE) + (GRID_SIZE // 2)
-        y = self.map_y + (robot.y * GRID_SIZE) + (GRID_SIZE // 2)
+        self._dirty_rects.append(self.screen.blit(*self._robot_blit(robot)))
+    
+    def _robot_blit(self, robot):
+        """
+        Pick the cached sprite for a robot's current appearance
         
-        # Shadow
-        pygame.draw.circle(self.screen, (0, 0, 0, 30), (x + 2, y + 2), 14)
+        Args:
+            robot: Robot to draw
+        
+        Returns:
+            tuple: (sprite, top-left screen position), ready for Surface.blit
+        """
+        x = self._cell_cx[robot.x]
+        y = self._cell_cy[robot.y]
         
         # Robot body with pulse animation for busy robots
         radius = 13
-        if robot.status.value == "Busy":
+        status = robot.status
+        if status is RobotStatus.BUSY:
             pulse = abs((self.animation_frame % 40) - 20) / 20.0
             radius = int(13 + pulse * 2)
         
+        # Status dot; statuses without a colour of their own show as available
+        dot_color = self.status_colors.get(status, self.success)
+        
+        # Battery fill
+        battery = robot.charge_percentage
+        fill_width = int(18 * battery / 100)
+        if battery > 50:
+            fill_color = self.success
+        elif battery > 20:
+            fill_color = self.warning
+        else:
+            fill_color = self.danger
+        
+        key = (robot.color, radius, dot_color, fill_width, fill_color)
+        sprite = self._robot_sprites.get(key)
+        if sprite is None:
+            sprite = self._render_robot_sprite(*key)
+            self._robot_sprites[key] = sprite
+        return sprite, (x - ROBOT_SPRITE_HALF, y - ROBOT_SPRITE_HALF)
+    
+    def _render_robot_sprite(self, color, radius, dot_color, fill_width, fill_color):
+        """
+        Render a robot once so later frames only blit it
+        
+        Args:
+            color: Robot body colour
+            radius: Body radius (pulses while busy)
+            dot_color: Status dot colour
+            fill_width: Battery fill width in pixels
+            fill_color: Battery fill colour
+        
+        Returns:
+            pygame.Surface: Sprite centred at (ROBOT_SPRITE_HALF, ROBOT_SPRITE_HALF)
+        """
+        size = 2 * ROBOT_SPRITE_HALF
+        sprite = pygame.Surface((size, size)).convert(self.screen)
+        sprite.fill(SPRITE_KEY)
+        sprite.set_colorkey(SPRITE_KEY)
+        x = y = ROBOT_SPRITE_HALF
+        
+        # Shadow
+        pygame.draw.circle(sprite, (0, 0, 0, 30), (x + 2, y + 2), 14)
+        
         # Main circle
-        pygame.draw.circle(self.screen, robot.color, (x, y), radius)
-        pygame.draw.circle(self.screen, (255, 255, 255), (x, y), radius - 4)
+        pygame.draw.circle(sprite, color, (x, y), radius)
+        pygame.draw.circle(sprite, (255, 255, 255), (x, y), radius - 4)
         
         # Status dot
-        dot_radius = 4
-        if robot.status.value == "Busy":
-            pygame.draw.circle(self.screen, self.danger, (x, y), dot_radius)
-        elif robot.status.value == "Charging":
-            pygame.draw.circle(self.screen, self.warning, (x, y), dot_radius)
-        else:
-            pygame.draw.circle(self.screen, self.success, (x, y), dot_radius)
+        pygame.draw.circle(sprite, dot_color, (x, y), 4)
         
         # Mini battery indicator
-        battery = robot.charge_percentage
         bar_width = 20
         bar_height = 3
         bar_x = x - (bar_width // 2)
         bar_y = y - 22
         
         # Battery outline
-        pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), 1)
+        pygame.draw.rect(sprite, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), 1)
         
         # Battery fill
-        fill_width = int((bar_width - 2) * battery / 100)
-        if battery > 50:
-            fill_color = self.success
-        elif battery > 20:
-            fill_color = self.warning
-        else:
-            fill_color = self.danger
-        pygame.draw.rect(self.screen, fill_color, (bar_x + 1, bar_y + 1, fill_width, bar_height - 2))
+        pygame.draw.rect(sprite, fill_color, (bar_x + 1, bar_y + 1, fill_width, bar_height - 2))
+        return sprite
     
     def draw_robots(self, robots):
-        """Draw all robots"""
-        for robot in robots:
-            self.draw_robot_on_map(robot)
+        """Draw all robots with one batched blit"""
+        self._dirty_rects.extend(self.screen.blits([self._robot_blit(robot) for robot in robots]))
     
     def draw_path(self, path, color=None, width=3, animated=False):
-        """Draw path on map"""
-        if not path or len(path) < 2:
+        """Draw path on map (an (N, 2) array or a list of (x, y))"""
+        if path is None or len(path) < 2:
             return
         
-        path_color = color if color else COLORS['path']
+        path_color = color if color else PALETTE.path
+        
+        # Pixel centres of every cell in one vectorized step
+        centres = np.asarray(path) * GRID_SIZE + (GRID_SIZE // 2)
+        centres[:, 0] += self.map_x
+        centres[:, 1] += self.map_y
+        left, top = (centres.min(axis=0) - width).tolist()
+        right, bottom = (centres.max(axis=0) + width).tolist()
+        
+        if animated:
+            # Dash ends can fall on half pixels, which round half to even, so
+            # the frame origin keeps even coordinates to round the same way
+            left -= left % 2
+            top -= top % 2
+            # A path stays fixed while its task runs, so each dash phase is
+            # drawn once and then blitted
+            key = (centres.tobytes(), path_color, width)
+            frames = self._path_frames.get(key)
+            if frames is None:
+                if len(self._path_frames) >= PATH_CACHE_SIZE:
+                    self._path_frames.clear()
+                frames = self._render_dashed_path(centres.tolist(), path_color, width,
+                                                  pygame.Rect(left, top, right - left + 1, bottom - top + 1))
+                self._path_frames[key] = frames
+            self._dirty_rects.append(
+                self.screen.blit(frames[self.path_animation_offset], (left, top)))
+        else:
+            self._dirty_rects.append(pygame.Rect(left, top, right - left + 1, bottom - top + 1))
+            centres = centres.tolist()
+            for start, end in zip(centres, centres[1:]):
+                pygame.draw.line(self.screen, path_color, start, end, width)
         
-        for i in range(len(path) - 1):
-            x1 = self.map_x + (path[i][0] * GRID_SIZE) + (GRID_SIZE // 2)
-            y1 = self.map_y + (path[i][1] * GRID_SIZE) + (GRID_SIZE // 2)
-            x2 = self.map_x + (path[i+1][0] * GRID_SIZE) + (GRID_SIZE // 2)
-            y2 = self.map_y + (path[i+1][1] * GRID_SIZE) + (GRID_SIZE // 2)
-            
-            if animated:
-                # Dashed animated line
+        self.path_animation_offset = (self.path_animation_offset + 1) % PATH_DASH_PHASES
+    
+    def _render_dashed_path(self, centres, color, width, area):
+        """
+        Render every phase of an animated dashed path
+        
+        Dash ends are computed in screen coordinates exactly as a direct draw
+        would, then moved to the frame by an integer offset, so they round to
+        the same pixels.
+        
+        Args:
+            centres: Screen pixel centres of the path cells
+            color: Dash colour
+            width: Line width
+            area: Screen rect covered by the frames
+        
+        Returns:
+            list: One colour-keyed surface per dash phase
+        """
+        draw_line = pygame.draw.line
+        left, top = area.topleft
+        frames = []
+        for phase in range(PATH_DASH_PHASES):
+            frame = pygame.Surface(area.size).convert(self.screen)
+            frame.fill(SPRITE_KEY)
+            frame.set_colorkey(SPRITE_KEY)
+            for (x1, y1), (x2, y2) in zip(centres, centres[1:]):
+                # (j + 1) / segments never exceeds 1
                 dx = x2 - x1
                 dy = y2 - y1
-                dist = (dx**2 + dy**2)**0.5
-                if dist > 0:
-                    segments = int(dist / 8)
-                    for j in range(segments):
-                        if (j + self.path_animation_offset) % 4 < 2:
-                            t1 = j / segments
-                            t2 = min((j + 1) / segments, 1.0)
-                            px1 = x1 + dx * t1
-                            py1 = y1 + dy * t1
-                            px2 = x1 + dx * t2
-                            py2 = y1 + dy * t2
-                            pygame.draw.line(self.screen, path_color, (px1, py1), (px2, py2), width)
-            else:
-                pygame.draw.line(self.screen, path_color, (x1, y1), (x2, y2), width)
-        
-        self.path_animation_offset = (self.path_animation_offset + 1) % 4
+                segments = int((dx * dx + dy * dy) ** 0.5 / 8)
+                for j in range(segments):
+                    if (j + phase) % PATH_DASH_PHASES < 2:
+                        t1 = j / segments
+                        t2 = (j + 1) / segments
+                        draw_line(frame, color, (x1 + dx * t1 - left, y1 + dy * t1 - top),
+                                  (x1 + dx * t2 - left, y1 + dy * t2 - top), width)
+            frames.append(frame)
+        return frames
     
     def draw_task_animation(self, task, robot):
         """Draw task animation on map"""
         if not task or not robot:
             return
         
-        sx = self.map_x + (task.source_x * GRID_SIZE) + (GRID_SIZE // 2)
-        sy = self.map_y + (task.source_y * GRID_SIZE) + (GRID_SIZE // 2)
-        dx = self.map_x + (task.dest_x * GRID_SIZE) + (GRID_SIZE // 2)
-        dy = self.map_y + (task.dest_y * GRID_SIZE) + (GRID_SIZE // 2)
+        sx = self._cell_cx[task.source_x]
+        sy = self._cell_cy[task.source_y]
+        dx = self._cell_cx[task.dest_x]
+        dy = self._cell_cy[task.dest_y]
+        
+        self._dirty_rects.append(pygame.Rect(min(sx, dx) - 4, min(sy, dy) - 4,
+                                             abs(dx - sx) + 9, abs(dy - sy) + 9))
         
         # Animated particles
         for i in range(0, 100, 8):
@@ -235,7 +435,7 @@ class HospitalVisualization:
         
         self.animation_frame = (self.animation_frame + 1) % 60
 
-    def draw_right_panel(self, robots, tasks, current_task_info):
+    def draw_right_panel(self, robots, tasks, current_task_info, task_counts):
         """Draw redesigned right side panel with better layout"""
         px = self.panel_x
         py = self.panel_y
@@ -243,9 +443,8 @@ class HospitalVisualization:
         ph = self.map_height
         
         # Panel background
-        panel_rect = pygame.Rect(px, py, pw, ph)
-        pygame.draw.rect(self.screen, self.panel_bg, panel_rect)
-        pygame.draw.rect(self.screen, self.border, panel_rect, 2)
+        pygame.draw.rect(self.screen, self.panel_bg, self.panel_rect)
+        pygame.draw.rect(self.screen, self.border, self.panel_rect, 2)
         
         # Scrollable content area
         content_height = self._calculate_content_height(robots, tasks)
@@ -255,22 +454,20 @@ class HospitalVisualization:
         draw_y = py + 15 - self.scroll_offset
         
         # ===== SYSTEM OVERVIEW =====
-        draw_y = self._draw_system_overview(px, draw_y, pw, robots, tasks)
+        draw_y = self._draw_system_overview(px, draw_y, pw, robots, task_counts)
         
         # ===== ROBOTS SECTION =====
         draw_y = self._draw_robots_section(px, draw_y, pw, robots)
         
         # ===== TASKS SECTION =====
-        draw_y = self._draw_tasks_section(px, draw_y, pw, tasks)
+        draw_y = self._draw_tasks_section(px, draw_y, pw, tasks, task_counts)
         
         # ===== ACTIVE TASK =====
         draw_y = self._draw_active_task(px, draw_y, pw, current_task_info)
         
-        # ===== CONTROLS =====
-        draw_y = self._draw_controls_section(px, draw_y, pw)
-        
-        # ===== LEGEND =====
-        draw_y = self._draw_legend_section(px, draw_y, pw)
+        # ===== CONTROLS AND LEGEND (static) =====
+        self.screen.blit(self.static_panel_surface, (px + 10, draw_y))
+        draw_y += self.static_panel_surface.get_height()
         
         # Draw scroll bar if needed
         if content_height > ph:
@@ -283,147 +480,175 @@ class HospitalVisualization:
         tasks_height = 120  # Tasks section
         return base_height + robots_height + tasks_height
     
-    def _draw_system_overview(self, x, y, width, robots, tasks):
-        """Draw system overview section"""
+    def _build_overview_surface(self):
+        """
+        Render the fixed parts of the system overview off-screen
+        
+        The background is colour-keyed rather than panel-coloured because the
+        section scrolls across the panel's top border; all of its text sits on
+        the opaque header and tiles.
+        
+        Returns:
+            pygame.Surface: Header, stat tiles and stat labels
+        """
+        width = self.right_panel_width
+        surface = pygame.Surface((width - 20, 135)).convert(self.screen)
+        surface.fill(SPRITE_KEY)
+        surface.set_colorkey(SPRITE_KEY)
+        
+        # Sections draw 10 px inside their x, which is the surface's left edge here
+        x, y = -10, 0
+        
         # Header
-        header_rect = pygame.Rect(x + 10, y, width - 20, 35)
-        pygame.draw.rect(self.screen, self.panel_header, header_rect, border_radius=8)
+        rect = pygame.Rect(x + 10, y, width - 20, 35)
+        pygame.draw.rect(surface, self.panel_header, rect, border_radius=8)
         
-        title = self.font_medium.render("📊 SYSTEM OVERVIEW", True, self.text_primary)
-        self.screen.blit(title, (x + 20, y + 8))
+        title = self.render_text(self.font_medium, "📊 SYSTEM OVERVIEW", self.text_primary)
+        surface.blit(title, (x + 20, y + 8))
         
         y += 45
         
-        # Stats grid
-        stats = [
-            ("🤖 Robots", f"{len(robots)}", self.info),
-            ("✅ Completed", f"{sum(1 for t in tasks if t.status == 'Completed')}", self.success),
-            ("🔄 Active", f"{sum(1 for t in tasks if t.status == 'In Progress')}", self.warning),
-            ("⏳ Pending", f"{sum(1 for t in tasks if t.status == 'Pending')}", self.danger)
+        # Stat tiles in a 2x2 grid
+        for i, label in enumerate(OVERVIEW_STAT_LABELS):
+            stat_x = x + 15 + ((i % 2) * (width - 30) // 2)
+            stat_y = y + ((i // 2) * 50)
+            
+            rect.update(stat_x, stat_y, (width - 40) // 2, 40)
+            pygame.draw.rect(surface, (245, 247, 250), rect, border_radius=6)
+            pygame.draw.rect(surface, self.border, rect, 1, border_radius=6)
+            
+            label_text = self.render_text(self.font_tiny, label, self.text_secondary)
+            label_rect = label_text.get_rect(center=(stat_x + (width - 40) // 4, stat_y + 30))
+            surface.blit(label_text, label_rect)
+        
+        return surface
+    
+    def _draw_system_overview(self, x, y, width, robots, counts):
+        """Draw system overview section"""
+        # Header, tiles and labels never change; only the values are drawn per frame
+        self.screen.blit(self.overview_surface, (x + 10, y))
+        
+        y += 45
+        
+        # Stat values, in OVERVIEW_STAT_LABELS order
+        values = [
+            (f"{len(robots)}", self.info),
+            (f"{counts[TaskStatus.COMPLETED.value]}", self.success),
+            (f"{counts[TaskStatus.IN_PROGRESS.value]}", self.warning),
+            (f"{counts[TaskStatus.PENDING.value]}", self.danger)
         ]
         
-        # Draw stats in 2x2 grid
-        for i, (label, value, color) in enumerate(stats):
-            row = i // 2
-            col = i % 2
-            stat_x = x + 15 + (col * (width - 30) // 2)
-            stat_y = y + (row * 50)
+        for i, (value, color) in enumerate(values):
+            stat_x = x + 15 + ((i % 2) * (width - 30) // 2)
+            stat_y = y + ((i // 2) * 50)
             
-            stat_rect = pygame.Rect(stat_x, stat_y, (width - 40) // 2, 40)
-            pygame.draw.rect(self.screen, (245, 247, 250), stat_rect, border_radius=6)
-            pygame.draw.rect(self.screen, self.border, stat_rect, 1, border_radius=6)
-            
-            # Value
-            value_text = self.font_large.render(value, True, color)
+            value_text = self.render_text(self.font_large, value, color)
             value_rect = value_text.get_rect(center=(stat_x + (width - 40) // 4, stat_y + 15))
             self.screen.blit(value_text, value_rect)
-            
-            # Label
-            label_text = self.font_tiny.render(label, True, self.text_secondary)
-            label_rect = label_text.get_rect(center=(stat_x + (width - 40) // 4, stat_y + 30))
-            self.screen.blit(label_text, label_rect)
         
         return y + 110
     
     def _draw_robots_section(self, x, y, width, robots):
         """Draw robots section with compact cards"""
         # Header
-        header_rect = pygame.Rect(x + 10, y, width - 20, 30)
-        pygame.draw.rect(self.screen, self.panel_header, header_rect, border_radius=6)
+        rect = self._scratch_rect
+        rect.update(x + 10, y, width - 20, 30)
+        pygame.draw.rect(self.screen, self.panel_header, rect, border_radius=6)
         
-        title = self.font_medium.render(f"🤖 ROBOTS ({len(robots)})", True, self.text_primary)
+        title = self.render_text(self.font_medium, f"🤖 ROBOTS ({len(robots)})", self.text_primary)
         self.screen.blit(title, (x + 20, y + 6))
         
         y += 40
         
-        # Robot cards
-        for robot in robots:
-            if y - self.scroll_offset < self.panel_y + self.map_height:  # Only draw visible cards
-                y = self._draw_robot_card(robot, x, y, width)
-            else:
-                y += 70  # Account for hidden cards
+        # Robot cards are 60 px tall every 70 px; y is already scrolled, so
+        # only the slice of cards overlapping the panel viewport is drawn
+        first = max(0, (self.panel_y - y - 60) // 70 + 1)
+        last = min(len(robots), -((y - self.panel_y - self.map_height) // 70))
+        for i in range(first, last):
+            self._draw_robot_card(robots[i], x, y + i * 70, width)
         
-        return y + 10
+        return y + len(robots) * 70 + 10
     
     def _draw_robot_card(self, robot, x, y, width):
         """Draw individual robot card"""
-        card = pygame.Rect(x + 10, y, width - 20, 60)
+        rect = self._scratch_rect
+        rect.update(x + 10, y, width - 20, 60)
         
         # Card background with subtle shadow
-        pygame.draw.rect(self.screen, (250, 251, 252), card, border_radius=8)
-        pygame.draw.rect(self.screen, self.border, card, 1, border_radius=8)
+        pygame.draw.rect(self.screen, (250, 251, 252), rect, border_radius=8)
+        pygame.draw.rect(self.screen, self.border, rect, 1, border_radius=8)
         
         # Robot icon and name
-        icon_text = self.font_regular.render("🤖", True, self.text_primary)
+        icon_text = self.render_text(self.font_regular, "🤖", self.text_primary)
         self.screen.blit(icon_text, (x + 20, y + 8))
         
-        name_text = self.font_regular.render(robot.name, True, self.text_primary)
+        name_text = self.render_text(self.font_regular, robot.name, self.text_primary)
         self.screen.blit(name_text, (x + 45, y + 8))
         
         # Status with colored dot
-        status_color = {
-            "Available": self.success,
-            "Busy": self.danger,
-            "Charging": self.warning
-        }.get(robot.status.value, self.text_secondary)
+        status = robot.status
+        status_color = self.status_colors.get(status, self.text_secondary)
         
         pygame.draw.circle(self.screen, status_color, (x + width - 50, y + 15), 4)
-        status_text = self.font_small.render(robot.status.value, True, self.text_secondary)
+        status_text = self.render_text(self.font_small, status.value, self.text_secondary)
         self.screen.blit(status_text, (x + width - 40, y + 10))
         
         # Battery bar
         battery_width = width - 100
-        battery_bg = pygame.Rect(x + 20, y + 30, battery_width, 12)
-        pygame.draw.rect(self.screen, (230, 230, 235), battery_bg, border_radius=6)
+        rect.update(x + 20, y + 30, battery_width, 12)
+        pygame.draw.rect(self.screen, (230, 230, 235), rect, border_radius=6)
         
         battery = robot.charge_percentage
         fill_width = max(4, int((battery_width - 4) * battery / 100))
         fill_color = self.success if battery > 50 else self.warning if battery > 20 else self.danger
         
-        fill_rect = pygame.Rect(x + 22, y + 32, fill_width, 8)
-        pygame.draw.rect(self.screen, fill_color, fill_rect, border_radius=4)
+        rect.update(x + 22, y + 32, fill_width, 8)
+        pygame.draw.rect(self.screen, fill_color, rect, border_radius=4)
         
         # Battery text
-        battery_text = self.font_tiny.render(f"{battery:.0f}%", True, self.text_secondary)
+        battery_text = self.render_text(self.font_tiny, f"{battery:.0f}%", self.text_secondary)
         self.screen.blit(battery_text, (x + width - 40, y + 30))
         
         # Stats line
-        stats_text = self.font_tiny.render(
+        stats_text = self.render_text(
+            self.font_tiny,
             f"Tasks: {robot.completed_tasks} | Distance: {robot.total_distance:.0f}m | Speed: {robot.velocity}",
-            True, self.text_secondary
+            self.text_secondary
         )
         self.screen.blit(stats_text, (x + 20, y + 48))
         
         return y + 70
     
-    def _draw_tasks_section(self, x, y, width, tasks):
+    def _draw_tasks_section(self, x, y, width, tasks, counts):
         """Draw tasks progress section"""
         # Header
-        header_rect = pygame.Rect(x + 10, y, width - 20, 30)
-        pygame.draw.rect(self.screen, self.panel_header, header_rect, border_radius=6)
+        rect = self._scratch_rect
+        rect.update(x + 10, y, width - 20, 30)
+        pygame.draw.rect(self.screen, self.panel_header, rect, border_radius=6)
         
-        completed = sum(1 for t in tasks if t.status == "Completed")
+        completed = counts[TaskStatus.COMPLETED.value]
         total = len(tasks)
         progress = (completed / total * 100) if total > 0 else 0
         
-        title = self.font_medium.render(f"📋 TASKS ({completed}/{total})", True, self.text_primary)
+        title = self.render_text(self.font_medium, f"📋 TASKS ({completed}/{total})", self.text_primary)
         self.screen.blit(title, (x + 20, y + 6))
         
         y += 40
         
         # Progress bar
         bar_width = width - 40
-        bar_bg = pygame.Rect(x + 20, y, bar_width, 20)
-        pygame.draw.rect(self.screen, (230, 230, 235), bar_bg, border_radius=10)
+        rect.update(x + 20, y, bar_width, 20)
+        pygame.draw.rect(self.screen, (230, 230, 235), rect, border_radius=10)
+        bar_center = rect.center
         
         if progress > 0:
             fill_width = int((bar_width - 4) * progress / 100)
-            fill_rect = pygame.Rect(x + 22, y + 2, fill_width, 16)
-            pygame.draw.rect(self.screen, self.success, fill_rect, border_radius=8)
+            rect.update(x + 22, y + 2, fill_width, 16)
+            pygame.draw.rect(self.screen, self.success, rect, border_radius=8)
         
         # Progress text
-        progress_text = self.font_small.render(f"{progress:.1f}% Complete", True, self.text_primary)
-        text_rect = progress_text.get_rect(center=bar_bg.center)
+        progress_text = self.render_text(self.font_small, f"{progress:.1f}% Complete", self.text_primary)
+        text_rect = progress_text.get_rect(center=bar_center)
         self.screen.blit(progress_text, text_rect)
         
         y += 35
@@ -431,12 +656,12 @@ class HospitalVisualization:
         # Task breakdown
         breakdown = [
             ("✅ Completed", completed, self.success),
-            ("🔄 In Progress", sum(1 for t in tasks if t.status == "In Progress"), self.warning),
-            ("⏳ Pending", sum(1 for t in tasks if t.status == "Pending"), self.danger)
+            ("🔄 In Progress", counts[TaskStatus.IN_PROGRESS.value], self.warning),
+            ("⏳ Pending", counts[TaskStatus.PENDING.value], self.danger)
         ]
         
         for label, count, color in breakdown:
-            breakdown_text = self.font_small.render(f"{label}: {count}", True, color)
+            breakdown_text = self.render_text(self.font_small, f"{label}: {count}", color)
             self.screen.blit(breakdown_text, (x + 20, y))
             y += 20
         
@@ -445,44 +670,75 @@ class HospitalVisualization:
     def _draw_active_task(self, x, y, width, current_task_info):
         """Draw active task section"""
         # Header
-        header_rect = pygame.Rect(x + 10, y, width - 20, 30)
-        pygame.draw.rect(self.screen, self.panel_header, header_rect, border_radius=6)
+        rect = self._scratch_rect
+        rect.update(x + 10, y, width - 20, 30)
+        pygame.draw.rect(self.screen, self.panel_header, rect, border_radius=6)
         
-        title = self.font_medium.render("🎯 ACTIVE TASK", True, self.text_primary)
+        title = self.render_text(self.font_medium, "🎯 ACTIVE TASK", self.text_primary)
         self.screen.blit(title, (x + 20, y + 6))
         
         y += 40
         
         if current_task_info:
             # Active task card with animation
-            card = pygame.Rect(x + 10, y, width - 20, 80)
+            rect.update(x + 10, y, width - 20, 80)
             border_color = self.accent if self.animation_frame % 60 < 30 else (100, 160, 255)
             
-            pygame.draw.rect(self.screen, (240, 248, 255), card, border_radius=8)
-            pygame.draw.rect(self.screen, border_color, card, 2, border_radius=8)
+            pygame.draw.rect(self.screen, (240, 248, 255), rect, border_radius=8)
+            pygame.draw.rect(self.screen, border_color, rect, 2, border_radius=8)
             
             # Wrap task info text
             task_lines = self._wrap_text(current_task_info, self.font_small, width - 50)
             for i, line in enumerate(task_lines[:3]):  # Max 3 lines
-                task_text = self.font_small.render(line, True, self.accent)
+                task_text = self.render_text(self.font_small, line, self.accent)
                 self.screen.blit(task_text, (x + 20, y + 15 + (i * 18)))
             
             y += 90
         else:
-            no_task = self.font_small.render("No active tasks", True, self.text_secondary)
+            no_task = self.render_text(self.font_small, "No active tasks", self.text_secondary)
             self.screen.blit(no_task, (x + 20, y))
             y += 40
         
         return y
     
-    def _draw_controls_section(self, x, y, width):
-        """Draw controls section"""
+    def _build_static_panel_surface(self):
+        """
+        Render the controls and legend sections off-screen
+        
+        Both sections are fixed text and colour chips, so the right panel
+        blits them instead of redrawing them. The surface starts at the
+        panel's inner margin and leaves the panel border untouched.
+        
+        Returns:
+            pygame.Surface: Controls followed by the legend on the panel background
+        """
+        width = self.right_panel_width
+        surface = pygame.Surface((width - 20, self.map_height)).convert(self.screen)
+        surface.fill(self.panel_bg)
+        
+        # Sections draw 10 px inside their x, which is the surface's left edge here
+        y = self._draw_controls_section(surface, -10, 0, width)
+        y = self._draw_legend_section(surface, -10, y, width)
+        return surface.subsurface((0, 0, width - 20, y)).copy()
+    
+    def _draw_controls_section(self, surface, x, y, width):
+        """
+        Draw controls section
+        
+        Args:
+            surface: Target surface
+            x, y: Top-left corner of the section
+            width: Section width
+        
+        Returns:
+            int: y coordinate below the section
+        """
         # Header
         header_rect = pygame.Rect(x + 10, y, width - 20, 30)
-        pygame.draw.rect(self.screen, self.panel_header, header_rect, border_radius=6)
+        pygame.draw.rect(surface, self.panel_header, header_rect, border_radius=6)
         
-        title = self.font_medium.render("⌨️ CONTROLS", True, self.text_primary)
-        self.screen.blit(title, (x + 20, y + 6))
+        title = self.render_text(self.font_medium, "⌨️ CONTROLS", self.text_primary)
+        surface.blit(title, (x + 20, y + 6))
         
         y += 40
         
@@ -496,37 +752,47 @@ class HospitalVisualization:
         for key, desc, color in controls:
             # Key button
             key_rect = pygame.Rect(x + 20, y, 70, 25)
-            pygame.draw.rect(self.screen, color, key_rect, border_radius=6)
+            pygame.draw.rect(surface, color, key_rect, border_radius=6)
             
-            key_text = self.font_small.render(key, True, (255, 255, 255))
+            key_text = self.render_text(self.font_small, key, (255, 255, 255))
             key_rect_center = key_text.get_rect(center=key_rect.center)
-            self.screen.blit(key_text, key_rect_center)
+            surface.blit(key_text, key_rect_center)
             
             # Description
-            desc_text = self.font_small.render(desc, True, self.text_primary)
-            self.screen.blit(desc_text, (x + 100, y + 5))
+            desc_text = self.render_text(self.font_small, desc, self.text_primary)
+            surface.blit(desc_text, (x + 100, y + 5))
             
             y += 35
         
         return y
     
-    def _draw_legend_section(self, x, y, width):
-        """Draw map legend section"""
+    def _draw_legend_section(self, surface, x, y, width):
+        """
+        Draw map legend section
+        
+        Args:
+            surface: Target surface
+            x, y: Top-left corner of the section
+            width: Section width
+        
+        Returns:
+            int: y coordinate below the section
+        """
         # Header
         header_rect = pygame.Rect(x + 10, y, width - 20, 30)
-        pygame.draw.rect(self.screen, self.panel_header, header_rect, border_radius=6)
+        pygame.draw.rect(surface, self.panel_header, header_rect, border_radius=6)
         
-        title = self.font_medium.render("🗺️ MAP LEGEND", True, self.text_primary)
-        self.screen.blit(title, (x + 20, y + 6))
+        title = self.render_text(self.font_medium, "🗺️ MAP LEGEND", self.text_primary)
+        surface.blit(title, (x + 20, y + 6))
         
         y += 40
         
         legend_items = [
-            (COLORS['wall'], "Wall", "#"),
-            (COLORS['source'], "Source", "S"),
-            (COLORS['destination'], "Destination", "D"),
-            (COLORS['obstacle'], "Obstacle", "O"),
-            (COLORS['path'], "Robot Path", "---")
+            (PALETTE.wall, "Wall", "#"),
+            (PALETTE.source, "Source", "S"),
+            (PALETTE.destination, "Destination", "D"),
+            (PALETTE.obstacle, "Obstacle", "O"),
+            (PALETTE.path, "Robot Path", "---")
         ]
         
         for i, (color, label, symbol) in enumerate(legend_items):
@@ -534,21 +800,32 @@ class HospitalVisualization:
             
             # Color box
             color_rect = pygame.Rect(x + 20, row_y, 20, 15)
-            pygame.draw.rect(self.screen, color, color_rect, border_radius=3)
-            pygame.draw.rect(self.screen, self.border, color_rect, 1, border_radius=3)
+            pygame.draw.rect(surface, color, color_rect, border_radius=3)
+            pygame.draw.rect(surface, self.border, color_rect, 1, border_radius=3)
             
             # Symbol
-            symbol_text = self.font_small.render(symbol, True, self.text_primary)
-            self.screen.blit(symbol_text, (x + 45, row_y))
+            symbol_text = self.render_text(self.font_small, symbol, self.text_primary)
+            surface.blit(symbol_text, (x + 45, row_y))
             
             # Label
-            label_text = self.font_small.render(label, True, self.text_secondary)
-            self.screen.blit(label_text, (x + 80, row_y))
+            label_text = self.render_text(self.font_small, label, self.text_secondary)
+            surface.blit(label_text, (x + 80, row_y))
         
         return y + (len(legend_items) * 25) + 20
     
     def _wrap_text(self, text, font, max_width):
-        """Wrap text to fit within max_width"""
+        """Wrap text to fit within max_width, reusing the result for repeated text"""
+        key = (font, text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            if len(self._wrap_cache) >= WRAP_CACHE_SIZE:
+                self._wrap_cache.clear()
+            lines = tuple(self._measure_wrap(text, font, max_width))
+            self._wrap_cache[key] = lines
+        return lines
+    
+    def _measure_wrap(self, text, font, max_width):
+        """Split text into lines no wider than max_width, measuring each candidate line"""
         words = text.split()
         lines = []
         current_line = []
@@ -579,22 +856,41 @@ class HospitalVisualization:
         scrollbar_height = max(30, int(height * visible_ratio))
         scrollbar_y = y + (self.scroll_offset / content_height) * height
         
-        scrollbar_rect = pygame.Rect(scrollbar_x, scrollbar_y, scrollbar_width, scrollbar_height)
-        pygame.draw.rect(self.screen, (200, 200, 200), scrollbar_rect, border_radius=4)
-        pygame.draw.rect(self.screen, (150, 150, 150), scrollbar_rect, 1, border_radius=4)
+        rect = self._scratch_rect
+        rect.update(scrollbar_x, scrollbar_y, scrollbar_width, scrollbar_height)
+        pygame.draw.rect(self.screen, (200, 200, 200), rect, border_radius=4)
+        pygame.draw.rect(self.screen, (150, 150, 150), rect, 1, border_radius=4)
     
     def handle_scroll(self, event):
         """Handle mouse scroll events"""
         if event.type == pygame.MOUSEWHEEL:
             self.scroll_offset = max(0, min(self.max_scroll, self.scroll_offset - event.y * 30))
+            self.needs_redraw = True
     
-    def draw_dashboard(self, robots, tasks, current_task_info):
-        """Main drawing function"""
+    def draw_dashboard(self, robots, tasks, current_task_info, task_counts=None):
+        """
+        Main drawing function
+        
+        Args:
+            robots: Robots to draw
+            tasks: Task list shown in the panel
+            current_task_info: Active task caption
+            task_counts: Number of tasks per TaskStatus value; counted from
+                tasks when omitted
+        """
+        if task_counts is None:
+            task_counts = Counter(task.status for task in tasks)
+        self._dirty_rects = []  # A new frame; anything drawn but never pushed is moot
         self.screen.fill(self.bg_main)
         self.draw_top_bar()
         self.draw_hospital_map()
         self.draw_robots(robots)  # Draw robots on map
-        self.draw_right_panel(robots, tasks, current_task_info)
+        
+        # Scrolled panel content must not spill over the top bar
+        self.screen.set_clip(self.panel_rect)
+        self.draw_right_panel(robots, tasks, current_task_info, task_counts)
+        self.screen.set_clip(None)
+        self._dirty_rects.append(self.panel_rect)
     
     def handle_events(self):
         """Handle pygame events including scroll"""
@@ -614,12 +910,20 @@ class HospitalVisualization:
                     return "reset"
             elif event.type == pygame.MOUSEWHEEL:
                 self.handle_scroll(event)
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.needs_redraw = True
+                self._full_update = True
         return None
     
     def update(self):
         """Update display"""
-        pygame.display.flip()
-        self.clock.tick(60)
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+        else:
+            pygame.display.update(self._last_dirty_rects + self._dirty_rects)
+        self._last_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
         self.animation_frame += 1
 
 